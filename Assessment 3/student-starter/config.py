@@ -17,11 +17,46 @@ Complexity Level: SIMPLE (~75 lines of code)
 """
 
 import os
-from typing import Dict, List, Any
+import tempfile
+from contextlib import contextmanager
+from datetime import date
+from typing import Callable, Dict, Any, Iterator, Optional, TextIO, Tuple
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file once per process. The flag
+# survives importlib.reload, and override=False keeps variables that are
+# already set (e.g. inherited from a parent process).
+if not globals().get("_DOTENV_LOADED"):
+    load_dotenv(override=False)
+    _DOTENV_LOADED = True
+
+# ODBC connection attribute for the TDS packet size; the SQL Server ODBC
+# driver has no connection string keyword for it, so it is set before connecting
+SQL_ATTR_PACKET_SIZE = 112
+
+
+@contextmanager
+def bulk_load_file(
+    config: "InsuranceETLConfig", write: Callable[[TextIO], None]
+) -> Iterator[str]:
+    """
+    Write a CSV file for BULK INSERT into the configured bulk load directory
+
+    Args:
+        config: Configuration with a bulk_load_dir set
+        write: Writes the CSV rows to the open file
+
+    Yields:
+        str: The file path as a quoted SQL string literal (the file is
+        removed once the block exits)
+    """
+    fd, path = tempfile.mkstemp(suffix=".csv", dir=config.bulk_load_dir)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as csv_file:
+            write(csv_file)
+        yield "'" + path.replace("'", "''") + "'"
+    finally:
+        os.remove(path)
 
 
 class InsuranceETLConfig:
@@ -41,10 +76,20 @@ class InsuranceETLConfig:
         self.db_username = os.getenv("DB_USER")
         self.db_password = os.getenv("DB_PASSWORD")
         self.db_driver = os.getenv("DB_DRIVER", "ODBC Driver 17 for SQL Server")
+        # Seconds a statement may run before it is cancelled (0 waits forever)
+        self.db_query_timeout = int(os.getenv("DB_QUERY_TIMEOUT", "0"))
+        # TDS packet size in bytes; the largest size sends bulk loads in the
+        # fewest packets
+        self.db_packet_size = int(os.getenv("DB_PACKET_SIZE", "32767"))
 
         # Insurance Star Schema Table Definitions
-        self.dimensions = ["dim_customer", "dim_policy", "dim_agent", "dim_date"]
-        self.facts = ["fact_claims"]
+        self.dimensions: Tuple[str, ...] = (
+            "dim_customer",
+            "dim_policy",
+            "dim_agent",
+            "dim_date",
+        )
+        self.facts: Tuple[str, ...] = ("fact_claims",)
 
         # Data Source Configuration
         self.data_sources = {
@@ -55,6 +100,21 @@ class InsuranceETLConfig:
 
         # Processing Settings
         self.batch_size = 1000
+        self.commit_every_n_batches = 10  # Commit dimension/fact loads periodically
+        self.loader_parallelism = 4  # Connections loading fact batches
+
+        # Loads larger than this go through a server-side staging table
+        self.bulk_load_threshold = 5000
+        # Directory for BULK INSERT files, e.g. a share; the SQL Server service
+        # must be able to read it under the same path. BULK INSERT is only
+        # used when it is set
+        self.bulk_load_dir = os.getenv("BULK_LOAD_DIR") or None
+        self.fact_bulk_insert_threshold = 50000  # Claims staged with BULK INSERT
+        # Disable fact_claims nonclustered indexes during large loads and
+        # rebuild them afterwards
+        bulk_load_mode = os.getenv("BULK_LOAD_MODE", "false")
+        self.bulk_load_mode = bulk_load_mode.lower() in ("1", "true", "yes")
+
         self.date_range_start = "2020-01-01"
         self.date_range_end = "2025-12-31"
 
@@ -64,6 +124,9 @@ class InsuranceETLConfig:
 
         self._validate_config()
 
+        # Build the connection string once; settings don't change after validation
+        self._connection_string = self._build_connection_string()
+
     def _validate_config(self):
         """Validate configuration settings and raise errors for missing required values"""
         # Step 1: Validate database credentials based on authentication type
@@ -75,70 +138,99 @@ class InsuranceETLConfig:
 
         # Step 2: Validate data source file paths exist
         for source_name, file_path in self.data_sources.items():
-            if not os.path.exists(file_path):
+            if not os.path.isfile(file_path):
                 print(f"Warning: Data source file not found: {file_path}")
                 # Don't raise error - files may not exist during initial setup
 
         # Step 3: Validate date range format and logic
+        # date.fromisoformat uses a dedicated C parser instead of strptime's format matching
         try:
-            from datetime import datetime
-
-            start_date = datetime.strptime(self.date_range_start, "%Y-%m-%d")
-            end_date = datetime.strptime(self.date_range_end, "%Y-%m-%d")
-
-            if start_date >= end_date:
-                raise ValueError("date_range_start must be before date_range_end")
-
+            start_date = date.fromisoformat(self.date_range_start)
+            end_date = date.fromisoformat(self.date_range_end)
         except ValueError as e:
-            if "time data" in str(e):
-                raise ValueError(f"Invalid date format. Use YYYY-MM-DD format: {e}")
-            else:
-                raise
+            raise ValueError(f"Invalid date format. Use YYYY-MM-DD format: {e}")
+
+        if start_date >= end_date:
+            raise ValueError("date_range_start must be before date_range_end")
 
         # Step 4: Validate batch size is reasonable
         if self.batch_size <= 0 or self.batch_size > 10000:
             raise ValueError("batch_size must be between 1 and 10000")
 
-        # Step 5: Create log directory if it doesn't exist
+        if self.commit_every_n_batches <= 0:
+            raise ValueError("commit_every_n_batches must be at least 1")
+
+        if self.loader_parallelism <= 0:
+            raise ValueError("loader_parallelism must be at least 1")
+
+        if not 512 <= self.db_packet_size <= 32767:
+            raise ValueError("DB_PACKET_SIZE must be between 512 and 32767")
+
+        # Step 5: Create log directory if it doesn't exist (exist_ok skips the extra stat)
         log_dir = os.path.dirname(self.log_file)
-        if log_dir and not os.path.exists(log_dir):
+        if log_dir:
             os.makedirs(log_dir, exist_ok=True)
 
     def get_connection_string(self) -> str:
+        """
+        Get SQL Server connection string built during initialization
+
+        Returns:
+            str: Formatted connection string for SQL Server
+        """
+        return self._connection_string
+
+    def get_connection_attributes(self) -> Dict[int, int]:
+        """
+        Get the ODBC attributes set before connecting (pyodbc attrs_before)
+
+        Returns:
+            Dict[int, int]: Connection attribute values by attribute id
+        """
+        return {SQL_ATTR_PACKET_SIZE: self.db_packet_size}
+
+    def refresh_connection_string(self) -> str:
+        """
+        Rebuild the cached connection string after changing database settings
+
+        Returns:
+            str: Formatted connection string for SQL Server
+        """
+        self._connection_string = self._build_connection_string()
+        return self._connection_string
+
+    def _build_connection_string(self) -> str:
         """
         Build SQL Server connection string based on authentication type
 
         Returns:
             str: Formatted connection string for SQL Server
         """
-        # Step 1: Build connection string based on authentication type
+        # Step 1: Collect the common connection attributes
+        parts = [
+            f"DRIVER={{{self.db_driver}}}",
+            f"SERVER={self.db_server}",
+            f"DATABASE={self.db_name}",
+        ]
+
+        # Step 2: Add credentials based on authentication type
         if self.db_auth_type.lower() == "integrated":
             # Windows integrated authentication (no username/password needed)
-            connection_string = (
-                f"DRIVER={{{self.db_driver}}};"
-                f"SERVER={self.db_server};"
-                f"DATABASE={self.db_name};"
-                f"Trusted_Connection=yes;"
-            )
+            parts.append("Trusted_Connection=yes")
         else:
             # SQL Server authentication (requires username and password)
-            connection_string = (
-                f"DRIVER={{{self.db_driver}}};"
-                f"SERVER={self.db_server};"
-                f"DATABASE={self.db_name};"
-                f"UID={self.db_username};"
-                f"PWD={self.db_password};"
-            )
+            parts.append(f"UID={self.db_username}")
+            parts.append(f"PWD={self.db_password}")
 
-        return connection_string
+        return ";".join(parts) + ";"
 
-    def get_dimension_tables(self) -> List[str]:
-        """Get list of dimension table names"""
-        return self.dimensions.copy()
+    def get_dimension_tables(self) -> Tuple[str, ...]:
+        """Get dimension table names (immutable, so no copy is needed)"""
+        return self.dimensions
 
-    def get_fact_tables(self) -> List[str]:
-        """Get list of fact table names"""
-        return self.facts.copy()
+    def get_fact_tables(self) -> Tuple[str, ...]:
+        """Get fact table names (immutable, so no copy is needed)"""
+        return self.facts
 
     def get_data_source_path(self, source_name: str) -> str:
         """
@@ -169,21 +261,38 @@ class InsuranceETLConfig:
         }
 
 
+# Cached configuration instance shared by every pipeline stage
+_config: Optional[InsuranceETLConfig] = None
+
+
 def load_config() -> InsuranceETLConfig:
     """
     Load and validate insurance ETL configuration
 
+    The configuration is built and validated once per process; later calls
+    return the same instance.
+
     Returns:
         InsuranceETLConfig: Validated configuration instance
 
     Raises:
         ValueError: If configuration validation fails
     """
-    try:
-        config = InsuranceETLConfig()
-        return config
-    except Exception as e:
-        raise ValueError(f"Failed to load configuration: {str(e)}")
+    global _config
+
+    if _config is None:
+        try:
+            _config = InsuranceETLConfig()
+        except Exception as e:
+            raise ValueError(f"Failed to load configuration: {str(e)}")
+
+    return _config
+
+
+def reset_config():
+    """Clear the cached configuration so the next load_config() rebuilds it"""
+    global _config
+    _config = None
 
 
 if __name__ == "__main__":
@@ -18,14 +18,89 @@ Target Audience: Beginner/Intermediate students
 Complexity Level: SIMPLE (~150 lines of code, 2 minor TODOs for students)
 """
 
-import csv
 import json
 import logging
-import os
+import warnings
+import numpy as np
+import pandas as pd
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from config import InsuranceETLConfig
 
+try:
+    import orjson  # Optional: faster native JSON parser
+except ImportError:
+    orjson = None
+
+# Maximum number of offending records listed in a single warning
+MAX_LOGGED_ISSUES = 20
+
+# Allowed policy_type values
+VALID_POLICY_TYPES = frozenset({"Auto", "Home", "Life"})
+
+# Expected columns in the customer CSV file (in output order)
+CUSTOMER_COLUMNS = [
+    "customer_id",
+    "first_name",
+    "last_name",
+    "email",
+    "phone",
+    "birth_date",
+    "address",
+    "city",
+    "state",
+    "risk_score",
+    "customer_since",
+]
+
+# Expected columns in the claims CSV file (in output order)
+CLAIM_COLUMNS = [
+    "claim_id",
+    "policy_id",
+    "customer_id",
+    "agent_id",
+    "claim_amount",
+    "coverage_amount",
+    "deductible_amount",
+    "payout_amount",
+    "filed_date",
+    "closed_date",
+    "processing_days",
+    "claim_status",
+]
+
+# Columns of the extracted policy records (in output order)
+POLICY_COLUMNS = [
+    "policy_id",
+    "customer_id",
+    "policy_type",
+    "coverage_amount",
+    "annual_premium",
+    "deductible",
+    "effective_date",
+    "expiration_date",
+    "status",
+]
+
+# Buffer size for CSV source files (fewer read() calls on large files)
+CSV_BUFFER_SIZE = 1 << 20
+
+# Errors that mean a CSV source could not be read or parsed
+CSV_READ_ERRORS = (
+    OSError,
+    UnicodeDecodeError,
+    pd.errors.ParserError,
+    pd.errors.EmptyDataError,
+)
+
+# Claims columns converted to float
+CLAIM_AMOUNT_COLUMNS = [
+    "claim_amount",
+    "coverage_amount",
+    "deductible_amount",
+    "payout_amount",
+]
+
 
 class InsuranceExtractor:
     """
@@ -45,7 +120,7 @@ class InsuranceExtractor:
         self.config = config
         self.logger = logging.getLogger(__name__)
 
-    def extract_all_sources(self) -> Dict[str, List[Dict[str, Any]]]:
+    def extract_all_sources(self) -> Dict[str, pd.DataFrame]:
         """
         Extract data from all configured insurance data sources
         This method is complete - it orchestrates all extractions.
@@ -78,81 +153,73 @@ class InsuranceExtractor:
             self.logger.error(f"Failed to extract data from sources: {str(e)}")
             raise
 
-    def extract_customers_csv(self, file_path: str) -> List[Dict[str, Any]]:
+    def extract_customers_csv(self, file_path: str) -> pd.DataFrame:
         """
         Extract customer data from CSV file
-        This method is complete - it calls your TODO helper methods.
+        This method is complete - it loads and cleans the file with pandas.
         """
         self.logger.info(f"Extracting customer data from: {file_path}")
 
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Customer data file not found: {file_path}")
-
-        customers = []
-
         try:
-            with open(file_path, "r", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 for header
-                    try:
-                        # Basic data validation and type conversion (calls your TODO helper)
-                        customer = {
-                            "customer_id": row.get("customer_id", "").strip(),
-                            "first_name": row.get("first_name", "").strip(),
-                            "last_name": row.get("last_name", "").strip(),
-                            "email": row.get("email", "").strip().lower(),
-                            "phone": row.get("phone", "").strip(),
-                            "birth_date": row.get("birth_date", "").strip(),
-                            "address": row.get("address", "").strip(),
-                            "city": row.get("city", "").strip(),
-                            "state": row.get("state", "").strip(),
-                            "risk_score": self._safe_float_conversion(
-                                row.get("risk_score", "0")
-                            ),
-                            "customer_since": row.get("customer_since", "").strip(),
-                        }
-
-                        # Basic validation
-                        if not customer["customer_id"]:
-                            self.logger.warning(
-                                f"Row {row_num}: Missing customer_id, skipping"
-                            )
-                            continue
-
-                        # Validate email format (basic check)
-                        if customer["email"] and "@" not in customer["email"]:
-                            self.logger.warning(
-                                f"Row {row_num}: Invalid email format: {customer['email']}"
-                            )
-
-                        customers.append(customer)
-
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Error processing customer row {row_num}: {e}"
-                        )
-                        continue
-
-        except Exception as e:
-            raise Exception(f"Failed to read customer CSV file: {str(e)}")
+            with open(
+                file_path, "r", encoding="utf-8", newline="", buffering=CSV_BUFFER_SIZE
+            ) as csvfile:
+                df = self._read_csv(csvfile)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Customer data file not found: {file_path}") from e
+        except CSV_READ_ERRORS as e:
+            raise RuntimeError(f"Failed to read customer CSV file: {e}") from e
+
+        # Missing columns default to empty strings, like row.get(field, "")
+        df = df.reindex(columns=CUSTOMER_COLUMNS, fill_value="")
+
+        # Basic data cleaning and type conversion, one column at a time
+        text_columns = [col for col in CUSTOMER_COLUMNS if col != "risk_score"]
+        for col in text_columns:
+            df[col] = df[col].str.strip()
+        df["email"] = df["email"].str.lower()
+        df["risk_score"] = (
+            pd.to_numeric(df["risk_score"].str.strip(), errors="coerce")
+            .fillna(0.0)
+            .astype("float64")
+        )
+
+        # Basic validation (+2 turns the index into a file row number after the header)
+        missing_id = df["customer_id"] == ""
+        self._warn_batch(
+            "Rows with missing customer_id skipped", (df.index[missing_id] + 2).tolist()
+        )
+
+        df = df[~missing_id]
+
+        # Validate email format (basic check)
+        invalid_email = df["email"].ne("") & ~df["email"].str.contains("@", regex=False)
+        bad_emails = df.loc[invalid_email, ["customer_id", "email"]]
+        self._warn_batch(
+            "Customers with invalid email format",
+            list(bad_emails.itertuples(index=False, name=None)),
+        )
+
+        customers = df.reset_index(drop=True)
 
         self.logger.info(f"Successfully extracted {len(customers)} customer records")
         return customers
 
-    def extract_policies_json(self, file_path: str) -> List[Dict[str, Any]]:
+    def extract_policies_json(self, file_path: str) -> pd.DataFrame:
         """
         Extract policy data from JSON file
         This method is complete - it calls your TODO helper methods.
         """
         self.logger.info(f"Extracting policy data from: {file_path}")
 
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Policy data file not found: {file_path}")
-
         try:
-            with open(file_path, "r", encoding="utf-8") as jsonfile:
-                policies_data = json.load(jsonfile)
+            if orjson is not None:
+                # orjson parses raw bytes, so read the file in binary mode
+                with open(file_path, "rb") as jsonfile:
+                    policies_data = orjson.loads(jsonfile.read())
+            else:
+                with open(file_path, "r", encoding="utf-8") as jsonfile:
+                    policies_data = json.load(jsonfile)
 
             if not isinstance(policies_data, list):
                 raise ValueError(
@@ -160,7 +227,12 @@ class InsuranceExtractor:
                 )
 
             policies = []
-            valid_policy_types = {"Auto", "Home", "Life"}
+            missing_policy_ids = []
+            missing_customer_ids = []
+            invalid_types = []
+            invalid_coverage = []
+            invalid_premiums = []
+            failed_rows = []
 
             for index, policy_raw in enumerate(policies_data):
                 try:
@@ -187,128 +259,117 @@ class InsuranceExtractor:
 
                     # Basic validation
                     if not policy["policy_id"]:
-                        self.logger.warning(
-                            f"Policy index {index}: Missing policy_id, skipping"
-                        )
+                        missing_policy_ids.append(index)
                         continue
 
                     if not policy["customer_id"]:
-                        self.logger.warning(
-                            f"Policy {policy['policy_id']}: Missing customer_id"
-                        )
+                        missing_customer_ids.append(policy["policy_id"])
 
                     # Validate policy type
-                    if policy["policy_type"] not in valid_policy_types:
-                        self.logger.warning(
-                            f"Policy {policy['policy_id']}: Invalid policy_type: {policy['policy_type']}"
+                    if policy["policy_type"] not in VALID_POLICY_TYPES:
+                        invalid_types.append(
+                            (policy["policy_id"], policy["policy_type"])
                         )
 
                     # Validate numeric values
                     if policy["coverage_amount"] <= 0:
-                        self.logger.warning(
-                            f"Policy {policy['policy_id']}: Invalid coverage_amount: {policy['coverage_amount']}"
+                        invalid_coverage.append(
+                            (policy["policy_id"], policy["coverage_amount"])
                         )
 
                     if policy["annual_premium"] <= 0:
-                        self.logger.warning(
-                            f"Policy {policy['policy_id']}: Invalid annual_premium: {policy['annual_premium']}"
+                        invalid_premiums.append(
+                            (policy["policy_id"], policy["annual_premium"])
                         )
 
                     policies.append(policy)
 
                 except Exception as e:
-                    self.logger.warning(f"Error processing policy index {index}: {e}")
+                    failed_rows.append((index, str(e)))
                     continue
 
-        except json.JSONDecodeError as e:
-            raise Exception(f"Invalid JSON format in policy file: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Failed to read policy JSON file: {str(e)}")
+            # Report validation issues once per category
+            self._warn_batch(
+                "Policy indexes with missing policy_id skipped", missing_policy_ids
+            )
+            self._warn_batch("Policies with missing customer_id", missing_customer_ids)
+            self._warn_batch("Policies with invalid policy_type", invalid_types)
+            self._warn_batch("Policies with invalid coverage_amount", invalid_coverage)
+            self._warn_batch("Policies with invalid annual_premium", invalid_premiums)
+            self._warn_batch("Policy indexes that failed processing", failed_rows)
+
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Policy data file not found: {file_path}") from e
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
+            raise RuntimeError(f"Invalid JSON format in policy file: {e}") from e
+        except (OSError, ValueError) as e:  # includes UnicodeDecodeError
+            raise RuntimeError(f"Failed to read policy JSON file: {e}") from e
+
+        policies = pd.DataFrame(policies, columns=POLICY_COLUMNS)
 
         self.logger.info(f"Successfully extracted {len(policies)} policy records")
         return policies
 
-    def extract_claims_csv(self, file_path: str) -> List[Dict[str, Any]]:
+    def extract_claims_csv(self, file_path: str) -> pd.DataFrame:
         """
         Extract claims data from CSV file
-        This method is complete - it calls your TODO helper methods.
+        This method is complete - it loads and cleans the file with pandas.
         """
         self.logger.info(f"Extracting claims data from: {file_path}")
 
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Claims data file not found: {file_path}")
-
-        claims = []
-
         try:
-            with open(file_path, "r", encoding="utf-8") as csvfile:
-                reader = csv.DictReader(csvfile)
-
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 for header
-                    try:
-                        # Data validation and type conversion (calls your TODO helpers)
-                        claim = {
-                            "claim_id": row.get("claim_id", "").strip(),
-                            "policy_id": row.get("policy_id", "").strip(),
-                            "customer_id": row.get("customer_id", "").strip(),
-                            "agent_id": row.get("agent_id", "").strip(),
-                            "claim_amount": self._safe_float_conversion(
-                                row.get("claim_amount", "0")
-                            ),
-                            "coverage_amount": self._safe_float_conversion(
-                                row.get("coverage_amount", "0")
-                            ),
-                            "deductible_amount": self._safe_float_conversion(
-                                row.get("deductible_amount", "0")
-                            ),
-                            "payout_amount": self._safe_float_conversion(
-                                row.get("payout_amount", "0")
-                            ),
-                            "filed_date": row.get("filed_date", "").strip(),
-                            "closed_date": row.get("closed_date", "").strip(),
-                            "processing_days": self._safe_int_conversion(
-                                row.get("processing_days", "0")
-                            ),
-                            "claim_status": row.get("claim_status", "").strip(),
-                        }
-
-                        # Basic validation
-                        if not claim["claim_id"]:
-                            self.logger.warning(
-                                f"Row {row_num}: Missing claim_id, skipping"
-                            )
-                            continue
-
-                        # Validate required references
-                        if not claim["policy_id"]:
-                            self.logger.warning(
-                                f"Claim {claim['claim_id']}: Missing policy_id"
-                            )
-
-                        if not claim["customer_id"]:
-                            self.logger.warning(
-                                f"Claim {claim['claim_id']}: Missing customer_id"
-                            )
-
-                        # Business rule validation
-                        if (
-                            claim["claim_amount"] > claim["coverage_amount"]
-                            and claim["coverage_amount"] > 0
-                        ):
-                            self.logger.warning(
-                                f"Claim {claim['claim_id']}: Claim amount exceeds coverage"
-                            )
-
-                        claims.append(claim)
-
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Error processing claims row {row_num}: {e}"
-                        )
-                        continue
-
-        except Exception as e:
-            raise Exception(f"Failed to read claims CSV file: {str(e)}")
+            with open(
+                file_path, "r", encoding="utf-8", newline="", buffering=CSV_BUFFER_SIZE
+            ) as csvfile:
+                df = self._read_csv(csvfile)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Claims data file not found: {file_path}") from e
+        except CSV_READ_ERRORS as e:
+            raise RuntimeError(f"Failed to read claims CSV file: {e}") from e
+
+        # Missing columns default to empty strings, like row.get(field, "")
+        df = df.reindex(columns=CLAIM_COLUMNS, fill_value="")
+
+        # Data cleaning and type conversion, one column at a time
+        for col in CLAIM_COLUMNS:
+            df[col] = df[col].str.strip()
+        for col in CLAIM_AMOUNT_COLUMNS:
+            df[col] = (
+                pd.to_numeric(df[col], errors="coerce").fillna(0.0).astype("float64")
+            )
+        # astype truncates decimals the same way int(float(value)) does; values
+        # it cannot cast (missing, infinite or beyond int64) become 0 first
+        processing_days = pd.to_numeric(df["processing_days"], errors="coerce")
+        castable = np.isfinite(processing_days) & (processing_days.abs() < 2**63)
+        df["processing_days"] = processing_days.where(castable, 0).astype("int64")
+
+        # Basic validation (+2 turns the index into a file row number after the header)
+        missing_id = df["claim_id"] == ""
+        self._warn_batch(
+            "Rows with missing claim_id skipped", (df.index[missing_id] + 2).tolist()
+        )
+        df = df[~missing_id]
+
+        # Validate required references
+        self._warn_batch(
+            "Claims with missing policy_id",
+            df.loc[df["policy_id"] == "", "claim_id"].tolist(),
+        )
+        self._warn_batch(
+            "Claims with missing customer_id",
+            df.loc[df["customer_id"] == "", "claim_id"].tolist(),
+        )
+
+        # Business rule validation
+        exceeds_coverage = (df["claim_amount"] > df["coverage_amount"]) & (
+            df["coverage_amount"] > 0
+        )
+        self._warn_batch(
+            "Claims where claim amount exceeds coverage",
+            df.loc[exceeds_coverage, "claim_id"].tolist(),
+        )
+
+        claims = df.reset_index(drop=True)
 
         self.logger.info(f"Successfully extracted {len(claims)} claims records")
         return claims
@@ -343,23 +404,16 @@ class InsuranceExtractor:
         """
         # TODO: Your implementation here
         # Remove this pass statement and implement the method
-        if isinstance(value, float): return value
-        elif isinstance(value, int): return float(value)
+        if isinstance(value, (int, float)): return float(value)
 
         try:
             if isinstance(value, str):
                 value = value.strip()
-            
-            if not value: # empty string
-                floatValue = 0.0
-            else:
-                floatValue = float(value) # Will throw error if not convertible
-        except TypeError:
-            floatValue = 0.0
-        except ValueError:
-            floatValue = 0.0
-        
-        return floatValue
+                if not value: # empty string
+                    return 0.0
+            return float(value) # Will throw error if not convertible
+        except (TypeError, ValueError):
+            return 0.0
 
     def _safe_int_conversion(self, value: Any) -> int:
         """
@@ -388,17 +442,21 @@ class InsuranceExtractor:
         # TODO: Your implementation here
         # Remove this pass statement and implement the method
         if isinstance(value, int): return value
-        
-        value = self._safe_float_conversion(value) # If cannot be parsed to float, returns 0.0
-        return int(value) # Truncates automatically
+
+        try:
+            if isinstance(value, str):
+                value = value.strip()
+                if not value: # empty string
+                    return 0
+            return int(float(value)) # Truncates automatically
+        except (TypeError, ValueError, OverflowError):
+            return 0
 
     # =====================================================================
     # COMPLETED METHODS - DO NOT MODIFY BELOW THIS LINE
     # =====================================================================
 
-    def validate_extracted_data(
-        self, extracted_data: Dict[str, List[Dict[str, Any]]]
-    ) -> bool:
+    def validate_extracted_data(self, extracted_data: Dict[str, pd.DataFrame]) -> bool:
         """
         Validate extracted data for completeness and referential integrity
         This method is complete.
@@ -406,9 +464,14 @@ class InsuranceExtractor:
         self.logger.info("Validating extracted data integrity")
 
         try:
-            customers = extracted_data.get("customers", [])
-            policies = extracted_data.get("policies", [])
-            claims = extracted_data.get("claims", [])
+            # A missing source is validated as an empty extract
+            customers = extracted_data.get(
+                "customers", pd.DataFrame(columns=CUSTOMER_COLUMNS)
+            )
+            policies = extracted_data.get(
+                "policies", pd.DataFrame(columns=POLICY_COLUMNS)
+            )
+            claims = extracted_data.get("claims", pd.DataFrame(columns=CLAIM_COLUMNS))
 
             # Check minimum record counts
             if len(customers) < 50:
@@ -425,22 +488,24 @@ class InsuranceExtractor:
                 self.logger.warning(f"Low claims count: {len(claims)} (expected ~650)")
 
             # Check referential integrity
-            customer_ids = {c["customer_id"] for c in customers}
-            policy_customer_ids = {p["customer_id"] for p in policies}
-            claims_customer_ids = {c["customer_id"] for c in claims}
+            customer_ids = customers["customer_id"].unique()
 
             # Find orphaned references
-            orphaned_policy_customers = policy_customer_ids - customer_ids
-            orphaned_claims_customers = claims_customer_ids - customer_ids
+            orphaned_policy_customers = self._orphaned_customer_ids(
+                policies, customer_ids
+            )
+            orphaned_claims_customers = self._orphaned_customer_ids(
+                claims, customer_ids
+            )
 
             if orphaned_policy_customers:
                 self.logger.warning(
-                    f"Policies with invalid customer references: {len(orphaned_policy_customers)}"
+                    f"Policies with invalid customer references: {orphaned_policy_customers}"
                 )
 
             if orphaned_claims_customers:
                 self.logger.warning(
-                    f"Claims with invalid customer references: {len(orphaned_claims_customers)}"
+                    f"Claims with invalid customer references: {orphaned_claims_customers}"
                 )
 
             self.logger.info("Data validation completed")
@@ -450,10 +515,78 @@ class InsuranceExtractor:
             self.logger.error(f"Data validation failed: {str(e)}")
             return False
 
+    def _orphaned_customer_ids(
+        self, records: pd.DataFrame, customer_ids: np.ndarray
+    ) -> int:
+        """
+        Count distinct customer ids in records that have no matching customer
+
+        Args:
+            records: Extracted policies or claims with a customer_id column
+            customer_ids: Distinct customer ids from the customer extract
+
+        Returns:
+            Number of distinct orphaned customer ids
+        """
+        orphaned = records.loc[
+            ~records["customer_id"].isin(customer_ids), "customer_id"
+        ]
+        return orphaned.nunique()
+
+    def _read_csv(self, csvfile) -> pd.DataFrame:
+        """
+        Read a CSV source as text in one vectorized pass
+
+        Malformed rows are skipped with one aggregate warning instead of
+        failing the whole file: rows with extra fields are dropped, and the
+        missing fields of short rows are read as empty strings.
+
+        Args:
+            csvfile: Open CSV file
 
-def extract_insurance_data(
-    config: InsuranceETLConfig,
-) -> Dict[str, List[Dict[str, Any]]]:
+        Returns:
+            pd.DataFrame: Every column as text
+        """
+        # Every column is read so the parser can count each row's fields
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", pd.errors.ParserWarning)
+            df = pd.read_csv(
+                csvfile,
+                dtype=str,
+                keep_default_na=False,
+                na_filter=False,
+                on_bad_lines="warn",
+            )
+
+        skipped = []
+        for warning in caught:
+            if issubclass(warning.category, pd.errors.ParserWarning):
+                skipped += str(warning.message).splitlines()
+            else:
+                warnings.warn(warning.message, warning.category)
+        self._warn_batch("Malformed rows skipped", [line for line in skipped if line])
+
+        return df.fillna("")
+
+    def _warn_batch(self, message: str, issues: List[Any]):
+        """
+        Log a single aggregate warning for a list of offending records
+
+        Args:
+            message: Description of the validation issue
+            issues: Row numbers, ids or (id, value) tuples that failed the check
+        """
+        if issues and self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(
+                "%s: %d (first %d: %s)",
+                message,
+                len(issues),
+                min(len(issues), MAX_LOGGED_ISSUES),
+                issues[:MAX_LOGGED_ISSUES],
+            )
+
+
+def extract_insurance_data(config: InsuranceETLConfig) -> Dict[str, pd.DataFrame]:
     """
     Convenience function to extract all insurance data sources
 
@@ -469,6 +602,7 @@ def extract_insurance_data(
 
 if __name__ == "__main__":
     # Test your TODO implementations
+    import tempfile
     from config import load_config
 
     try:
@@ -506,6 +640,22 @@ if __name__ == "__main__":
             result = extractor._safe_int_conversion(value)
             print(f"  {repr(value)} → {result} ({expected})")
 
+        # Malformed CSV rows are skipped one at a time, not fatal to the file
+        print("\nTesting ragged CSV rows")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            ragged_csv = Path(tmp_dir) / "claims.csv"
+            ragged_csv.write_text(
+                "claim_id,policy_id,customer_id\n"
+                "CLM001,POL001,CUST001\n"
+                "CLM002,POL002,CUST002,EXTRA\n"  # extra field: skipped
+                "CLM003\n"  # short row: missing fields read as empty
+                ",POL004\n",  # missing claim_id: skipped
+                encoding="utf-8",
+            )
+            claim_ids = extractor.extract_claims_csv(str(ragged_csv))["claim_id"]
+            print(f"  {claim_ids.tolist()} (Should be ['CLM001', 'CLM003'])")
+            assert claim_ids.tolist() == ["CLM001", "CLM003"]
+
         print("\n✅ TODO method testing completed!")
         print("Complete both TODO methods to make extraction work properly!")
 
@@ -24,11 +24,205 @@ Target Audience: Beginner/Intermediate students
 Complexity Level: MEDIUM (~175 lines of code, 2 TODO methods for students)
 """
 
+import csv
+import threading
 import pyodbc
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime, date
-from config import InsuranceETLConfig
+from config import InsuranceETLConfig, bulk_load_file
+
+# Let the ODBC driver manager reuse connections across loads and worker threads
+pyodbc.pooling = True
+
+# Maximum parameters per statement (SQL Server allows 2100)
+MAX_STATEMENT_PARAMS = 2000
+
+# Maximum rows sent in one multi-row MERGE statement
+MAX_MERGE_ROWS = 500
+
+# Rows fetched per fetchmany() call when reading keys back
+FETCH_SIZE = 5000
+
+# Errors caused by a record's data; other database errors (lost connection,
+# bad SQL) would fail every remaining row too, so they abort the load
+ROW_ERRORS = (pyodbc.IntegrityError, pyodbc.DataError, KeyError)
+
+# Failed records logged individually per batch before only counting the rest
+MAX_LOGGED_ROW_ERRORS = 10
+
+# Set the batch savepoint, opening a transaction first if none is active
+# (after a commit, SAVE TRANSACTION alone fails with "no active transaction").
+# In the driver's implicit transaction mode BEGIN TRANSACTION nests inside the
+# transaction it opens, so the extra level is committed straight away.
+SAVE_BATCH_SQL = (
+    "IF @@TRANCOUNT = 0 BEGIN "
+    "BEGIN TRANSACTION; IF @@TRANCOUNT > 1 COMMIT TRANSACTION; "
+    "END; "
+    "SAVE TRANSACTION dim_batch"
+)
+
+# SCD Type 1 settings for each dimension: business/surrogate key columns, the
+# attributes overwritten on update, and columns filled by SQL expressions
+# (src.load_time is the load timestamp, passed as a parameter)
+DIMENSIONS = {
+    "dim_customer": {
+        "entity": "customer",
+        "business_key": "customer_id",
+        "surrogate_key": "customer_key",
+        "attributes": (
+            "first_name",
+            "last_name",
+            "full_name",
+            "email",
+            "phone",
+            "birth_date",
+            "age",
+            "address",
+            "city",
+            "state",
+            "risk_score",
+            "risk_tier",
+            "customer_since",
+        ),
+        "on_update": {"updated_date": "src.load_time"},
+        "on_insert": {"updated_date": "src.load_time"},
+    },
+    "dim_policy": {
+        "entity": "policy",
+        "business_key": "policy_id",
+        "surrogate_key": "policy_key",
+        "attributes": (
+            "policy_type",
+            "coverage_amount",
+            "annual_premium",
+            "premium_tier",
+            "deductible",
+            "effective_date",
+            "expiration_date",
+            "status",
+        ),
+        "on_update": {"updated_date": "src.load_time"},
+        "on_insert": {"updated_date": "src.load_time"},
+    },
+    "dim_agent": {
+        "entity": "agent",
+        "business_key": "agent_id",
+        "surrogate_key": "agent_key",
+        "attributes": (
+            "first_name",
+            "last_name",
+            "full_name",
+            "region",
+            "experience_years",
+            "hire_date",
+        ),
+        "on_update": {},
+        "on_insert": {"created_date": "src.load_time", "is_active": "1"},
+    },
+}
+
+
+def _build_merge_sql(
+    table: str,
+    spec: Dict[str, Any],
+    source: Optional[str] = None,
+    output: bool = False,
+) -> str:
+    """
+    Build the SCD Type 1 MERGE statement for a dimension
+
+    Args:
+        table: Dimension table name
+        spec: Dimension settings from DIMENSIONS
+        source: Staging table to merge from; defaults to one parameter row
+        output: Return business key and surrogate key of every merged row
+
+    Returns:
+        MERGE statement (taking the business key, attribute values and load
+        time as parameters when no source table is given)
+    """
+    key = spec["business_key"]
+    columns = [key, *spec["attributes"]]
+
+    if source is None:
+        parameters = [f"? AS {column}" for column in columns] + ["? AS load_time"]
+        source = f"(SELECT {', '.join(parameters)})"
+    updates = [f"{column} = src.{column}" for column in spec["attributes"]]
+    updates += [f"{column} = {expr}" for column, expr in spec["on_update"].items()]
+    insert_columns = columns + list(spec["on_insert"])
+    insert_values = [f"src.{column}" for column in columns]
+    insert_values += list(spec["on_insert"].values())
+    returning = (
+        f" OUTPUT inserted.{key}, inserted.{spec['surrogate_key']}" if output else ""
+    )
+
+    return (
+        f"MERGE {table} WITH (HOLDLOCK) AS tgt "
+        f"USING {source} AS src ON tgt.{key} = src.{key} "
+        f"WHEN MATCHED THEN UPDATE SET {', '.join(updates)} "
+        f"WHEN NOT MATCHED THEN INSERT ({', '.join(insert_columns)}) "
+        f"VALUES ({', '.join(insert_values)}){returning};"
+    )
+
+
+@lru_cache(maxsize=None)
+def _build_multi_row_merge_sql(table: str, count: int) -> str:
+    """
+    Build (and cache per table and size) a MERGE over several parameter rows
+
+    The rows are sent as a VALUES table constructor and the statement
+    returns the business key and surrogate key of every merged row.
+
+    Args:
+        table: Dimension table name
+        count: Number of parameter rows
+
+    Returns:
+        MERGE statement taking count rows of business key, attribute values
+        and load time as parameters
+    """
+    spec = DIMENSIONS[table]
+    columns = [spec["business_key"], *spec["attributes"], "load_time"]
+    row = f"({', '.join('?' * len(columns))})"
+    source = (
+        f"(SELECT * FROM (VALUES {', '.join([row] * count)}) "
+        f"AS v ({', '.join(columns)}))"
+    )
+    return _build_merge_sql(table, spec, source=source, output=True)
+
+
+def _merge_rows_per_statement(spec: Dict[str, Any]) -> int:
+    """Rows per multi-row MERGE, keeping under the statement parameter limit"""
+    params_per_row = len(spec["attributes"]) + 2  # business key and load time
+    return min(MAX_MERGE_ROWS, MAX_STATEMENT_PARAMS // params_per_row)
+
+
+@lru_cache(maxsize=None)
+def _build_key_lookup_sql(table: str, count: int) -> str:
+    """
+    Build (and cache per table and size) the surrogate key lookup statement
+
+    Batches are usually config.batch_size records, so only the full-batch
+    and tail sizes are rendered in practice.
+
+    Args:
+        table: Dimension table name
+        count: Number of business keys in the IN list
+
+    Returns:
+        SELECT statement returning business key and surrogate key pairs
+    """
+    spec = DIMENSIONS[table]
+    placeholders = ", ".join("?" * count)
+    return (
+        f"SELECT {spec['business_key']}, {spec['surrogate_key']} "
+        f"FROM {table} WHERE {spec['business_key']} IN ({placeholders})"
+    )
 
 
 class InsuranceDimensionLoader:
@@ -48,17 +242,55 @@ class InsuranceDimensionLoader:
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.connection = None
-        self.cursor = None
+        # Each thread works on its own connection and cursor
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._persistent = None  # Connection kept open by a with block
+        self._merge_sql = {
+            table: _build_merge_sql(table, spec) for table, spec in DIMENSIONS.items()
+        }
+        # MERGE parameter rows: the business key, then the attribute values
+        self._row_params = {
+            table: itemgetter(spec["business_key"], *spec["attributes"])
+            for table, spec in DIMENSIONS.items()
+        }
+
+    def __enter__(self):
+        """Open a connection that is reused by every load in the with block"""
+        self._use_new_connection()
+        self._persistent = (self.connection, self.cursor)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Commit (or roll back on error) and close all connections"""
+        self._persistent = None
+        self._cleanup_connections(commit=exc_type is None)
+        return False
+
+    @property
+    def connection(self):
+        """Database connection used by the current thread"""
+        return getattr(self._local, "connection", None)
+
+    @property
+    def cursor(self):
+        """Database cursor used by the current thread"""
+        return getattr(self._local, "cursor", None)
 
     def load_all_dimensions(
-        self, transformed_data: Dict[str, List[Dict[str, Any]]]
+        self, transformed_data: Dict[str, Iterable[Dict[str, Any]]]
     ) -> Dict[str, Dict[str, int]]:
         """
         Load all dimension tables and return surrogate key mappings
 
+        Each connection commits every commit_every_n_batches batches, so a
+        failed load rolls back only the work since the last commit. The loads
+        are SCD Type 1 upserts, so re-running after a failure is safe.
+
         Args:
             transformed_data: Dictionary containing transformed dimension data
+                (lists or generators of records)
 
         Returns:
             Dictionary containing business key to surrogate key mappings for each dimension
@@ -73,25 +305,32 @@ class InsuranceDimensionLoader:
         """
         self.logger.info("Starting dimension loading for insurance star schema")
 
-        try:
-            # Connect to database
-            self._connect_to_database()
-
-            surrogate_key_mappings = {}
-
-            # Load customer dimension
-            customers = transformed_data.get("dim_customer", [])
-            surrogate_key_mappings["dim_customer"] = self.load_customer_dimension(
-                customers
-            )
-
-            # Load policy dimension
-            policies = transformed_data.get("dim_policy", [])
-            surrogate_key_mappings["dim_policy"] = self.load_policy_dimension(policies)
+        loads = {
+            "dim_customer": self.load_customer_dimension,
+            "dim_policy": self.load_policy_dimension,
+            "dim_agent": self.load_agent_dimension,
+        }
+        succeeded = False
 
-            # Load agent dimension
-            agents = transformed_data.get("dim_agent", [])
-            surrogate_key_mappings["dim_agent"] = self.load_agent_dimension(agents)
+        try:
+            # Connect to database (unless a with block already did)
+            if self._persistent is None:
+                self._use_new_connection()
+
+            # The dimensions share no keys, so load them concurrently, each in
+            # its own transaction on its own connection
+            with ThreadPoolExecutor(max_workers=len(loads)) as executor:
+                futures = {
+                    dim_name: executor.submit(
+                        self._load_on_new_connection,
+                        load,
+                        transformed_data.get(dim_name, []),
+                    )
+                    for dim_name, load in loads.items()
+                }
+                surrogate_key_mappings = {
+                    dim_name: future.result() for dim_name, future in futures.items()
+                }
 
             # Validate date dimension
             date_keys = transformed_data.get("date_keys", [])
@@ -102,24 +341,37 @@ class InsuranceDimensionLoader:
             for dim_name, mappings in surrogate_key_mappings.items():
                 self.logger.info(f"  - {dim_name}: {len(mappings)} records loaded")
 
+            succeeded = True
             return surrogate_key_mappings
 
         except Exception as e:
             self.logger.error(f"Failed to load dimensions: {str(e)}")
-            if self.connection:
-                self.connection.rollback()
             raise
         finally:
-            self._cleanup_connection()
+            # Commit the rest of every dimension, or roll back what has not
+            # been committed yet; batches committed periodically stay loaded,
+            # and a re-run merges over them
+            self._cleanup_connections(commit=succeeded)
+
+    def _load_on_new_connection(
+        self,
+        load: Callable[[Iterable[Dict[str, Any]]], Dict[str, int]],
+        records: Iterable[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        """Run a dimension load on a dedicated connection (worker threads)"""
+        if not records:
+            return load(records)  # nothing to load, so no connection needed
+        self._use_new_connection()
+        return load(records)
 
     def load_customer_dimension(
-        self, customers: List[Dict[str, Any]]
+        self, customers: Iterable[Dict[str, Any]]
     ) -> Dict[str, int]:
         """
         Load customer dimension with SCD Type 1 updates
 
         Args:
-            customers: List of transformed customer records
+            customers: Transformed customer records (list or generator)
 
         Returns:
             Dictionary mapping customer_id to customer_key (surrogate key)
@@ -130,17 +382,16 @@ class InsuranceDimensionLoader:
         - Generate surrogate keys for new customers
         - Update existing customers with new attribute values
         """
-        self.logger.info(f"Loading customer dimension with {len(customers)} records")
+        if not customers:
+            self.logger.info("No customer records to load")
+            return {}
 
-        surrogate_keys = {}
+        self.logger.info("Loading customer dimension")
 
         try:
-            # Process customers in batches for performance
-            batch_size = self.config.batch_size
-            for i in range(0, len(customers), batch_size):
-                batch = customers[i : i + batch_size]
-                batch_keys = self._process_customer_batch(batch)
-                surrogate_keys.update(batch_keys)
+            surrogate_keys = self._load_dimension(
+                "dim_customer", customers, self._process_customer_batch
+            )
 
             self.logger.info(f"Successfully loaded {len(surrogate_keys)} customers")
             return surrogate_keys
@@ -149,27 +400,28 @@ class InsuranceDimensionLoader:
             self.logger.error(f"Failed to load customer dimension: {str(e)}")
             raise
 
-    def load_policy_dimension(self, policies: List[Dict[str, Any]]) -> Dict[str, int]:
+    def load_policy_dimension(
+        self, policies: Iterable[Dict[str, Any]]
+    ) -> Dict[str, int]:
         """
         Load policy dimension with SCD Type 1 updates
 
         Args:
-            policies: List of transformed policy records
+            policies: Transformed policy records (list or generator)
 
         Returns:
             Dictionary mapping policy_id to policy_key (surrogate key)
         """
-        self.logger.info(f"Loading policy dimension with {len(policies)} records")
+        if not policies:
+            self.logger.info("No policy records to load")
+            return {}
 
-        surrogate_keys = {}
+        self.logger.info("Loading policy dimension")
 
         try:
-            # Process policies in batches
-            batch_size = self.config.batch_size
-            for i in range(0, len(policies), batch_size):
-                batch = policies[i : i + batch_size]
-                batch_keys = self._process_policy_batch(batch)
-                surrogate_keys.update(batch_keys)
+            surrogate_keys = self._load_dimension(
+                "dim_policy", policies, self._process_policy_batch
+            )
 
             self.logger.info(f"Successfully loaded {len(surrogate_keys)} policies")
             return surrogate_keys
@@ -178,27 +430,26 @@ class InsuranceDimensionLoader:
             self.logger.error(f"Failed to load policy dimension: {str(e)}")
             raise
 
-    def load_agent_dimension(self, agents: List[Dict[str, Any]]) -> Dict[str, int]:
+    def load_agent_dimension(self, agents: Iterable[Dict[str, Any]]) -> Dict[str, int]:
         """
         Load agent dimension with SCD Type 1 updates
 
         Args:
-            agents: List of transformed agent records
+            agents: Transformed agent records (list or generator)
 
         Returns:
             Dictionary mapping agent_id to agent_key (surrogate key)
         """
-        self.logger.info(f"Loading agent dimension with {len(agents)} records")
+        if not agents:
+            self.logger.info("No agent records to load")
+            return {}
 
-        surrogate_keys = {}
+        self.logger.info("Loading agent dimension")
 
         try:
-            # Process agents in batches
-            batch_size = self.config.batch_size
-            for i in range(0, len(agents), batch_size):
-                batch = agents[i : i + batch_size]
-                batch_keys = self._process_agent_batch(batch)
-                surrogate_keys.update(batch_keys)
+            surrogate_keys = self._load_dimension(
+                "dim_agent", agents, self._process_agent_batch
+            )
 
             self.logger.info(f"Successfully loaded {len(surrogate_keys)} agents")
             return surrogate_keys
@@ -207,6 +458,129 @@ class InsuranceDimensionLoader:
             self.logger.error(f"Failed to load agent dimension: {str(e)}")
             raise
 
+    def _load_dimension(
+        self,
+        table: str,
+        records: Iterable[Dict[str, Any]],
+        process_batch: Callable[[List[Dict[str, Any]]], Dict[str, int]],
+    ) -> Dict[str, int]:
+        """
+        Load dimension records in batches, or through BULK INSERT when large
+
+        Args:
+            table: Dimension table name (key of DIMENSIONS)
+            records: Transformed dimension records, read in a single pass
+            process_batch: Batch loader returning business key -> surrogate key
+
+        Returns:
+            Dictionary mapping business key to surrogate key
+        """
+        # A business key may appear more than once; as in SCD Type 1 the last
+        # occurrence wins, and each key gets one MERGE source row
+        business_key = DIMENSIONS[table]["business_key"]
+        unique_records = {}
+        total = 0
+        for total, record in enumerate(records, 1):
+            unique_records[record[business_key]] = record
+        records = list(unique_records.values())
+
+        self.logger.info(f"Read {total} records for {table}")
+        if len(records) < total:
+            self.logger.info(
+                f"Merged {total - len(records)} repeated "
+                f"{business_key} values in {table}"
+            )
+
+        # BULK INSERT needs a file the server can read, so only with bulk_load_dir
+        if self.config.bulk_load_dir and len(records) > self.config.bulk_load_threshold:
+            try:
+                return self._bulk_load_dimension(table, records)
+            except (pyodbc.Error, OSError) as e:
+                self.logger.warning(
+                    f"Bulk load of {table} failed, loading in batches: {e}"
+                )
+
+        # Batches are cut from the records as they are loaded
+        batch_size = self.config.batch_size
+        remaining = iter(records)
+        batches = iter(lambda: list(islice(remaining, batch_size)), [])
+
+        # One dimension's batches stay on one connection: concurrent
+        # MERGE ... WITH (HOLDLOCK) statements into the same table take
+        # key-range locks on its unique index and deadlock each other
+        results = [self._run_batch(process_batch, batch) for batch in batches]
+
+        # Build the mapping once from every batch's key pairs
+        return dict(chain.from_iterable(keys.items() for keys in results))
+
+    def _run_batch(
+        self,
+        process_batch: Callable[[List[Dict[str, Any]]], Dict[str, int]],
+        batch: List[Dict[str, Any]],
+    ) -> Dict[str, int]:
+        """
+        Process one batch on the current thread's connection
+
+        Args:
+            process_batch: Batch loader returning business key -> surrogate key
+            batch: Dimension records in the batch
+
+        Returns:
+            Dictionary mapping business key to surrogate key
+        """
+        surrogate_keys = process_batch(batch)
+
+        # Bound the work lost (and the log held) if a later batch fails
+        self._local.batches = getattr(self._local, "batches", 0) + 1
+        if self._local.batches % self.config.commit_every_n_batches == 0:
+            self.connection.commit()
+
+        return surrogate_keys
+
+    def _bulk_load_dimension(
+        self, table: str, records: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        Stage records with BULK INSERT and apply them with one set-based MERGE
+
+        Args:
+            table: Dimension table name (key of DIMENSIONS)
+            records: Transformed dimension records
+
+        Returns:
+            Dictionary mapping business key to surrogate key
+        """
+        spec = DIMENSIONS[table]
+        key = spec["business_key"]
+        columns = ", ".join([key, *spec["attributes"]])
+        stage = f"#stage_{table}"
+
+        self.logger.info(f"Bulk loading {len(records)} records into {table}")
+
+        load_time = (self._load_time(),)
+        rows = (row + load_time for row in map(self._row_params[table], records))
+
+        with bulk_load_file(
+            self.config, lambda stage_file: csv.writer(stage_file).writerows(rows)
+        ) as path:
+            self.cursor.execute(
+                f"SELECT TOP 0 {columns}, CAST(NULL AS DATETIME2(3)) AS load_time "
+                f"INTO {stage} FROM {table}"
+            )
+            try:
+                self.cursor.execute(
+                    f"BULK INSERT {stage} FROM {path} "
+                    "WITH (FORMAT = 'CSV', CODEPAGE = '65001', KEEPNULLS, TABLOCK)"
+                )
+                self.cursor.execute(_build_merge_sql(table, spec, source=stage))
+                self.cursor.execute(
+                    f"SELECT d.{key}, d.{spec['surrogate_key']} "
+                    f"FROM {table} d JOIN {stage} s ON s.{key} = d.{key}"
+                )
+                return dict(self._fetch_rows())
+            finally:
+                self.cursor.execute(f"DROP TABLE {stage}")
+
     # =====================================================================
     # STUDENT TODO METHODS - IMPLEMENT THESE!
     # =====================================================================
@@ -224,24 +598,21 @@ class InsuranceDimensionLoader:
         4. Return mapping of customer_id -> customer_key
 
         IMPLEMENTATION STEPS:
-        1. Initialize empty surrogate_keys dictionary
-        2. For each customer in the batch:
-           a. Execute SELECT query to check if customer_id exists
-           b. If exists: Execute UPDATE query with new values
-           c. If new: Execute INSERT query and get generated surrogate key
-           d. Add customer_id -> customer_key mapping to dictionary
-        3. Return the surrogate_keys dictionary
+        1. MERGE the customers in the batch into dim_customer: update the
+           matching row or insert a new one (several rows per statement)
+        2. Collect the customer_id -> customer_key pairs from the OUTPUT clause
+        3. Return the customer_id -> customer_key mapping for the whole batch
 
         SQL HINTS:
-        - Check existing: "SELECT customer_key FROM dim_customer WHERE customer_id = ?"
-        - Update: "UPDATE dim_customer SET first_name = ?, ... WHERE customer_id = ?"
-        - Insert: "INSERT INTO dim_customer (...) VALUES (...)"
-        - Get surrogate key: "SELECT @@IDENTITY" (after INSERT)
+        - Upsert: "MERGE dim_customer AS tgt USING (SELECT * FROM
+          (VALUES (?, ...), (?, ...)) AS v (customer_id, ...)) AS src
+          ON tgt.customer_id = src.customer_id
+          WHEN MATCHED THEN UPDATE ... WHEN NOT MATCHED THEN INSERT ...
+          OUTPUT inserted.customer_id, inserted.customer_key;"
 
         EXCEPTION HANDLING:
-        - Wrap individual customer processing in try/except
+        - If the batched statements fail, retry the batch one record at a time
         - Log warnings for failed customers but continue processing
-        - Use self.logger.warning() for individual failures
 
         Args:
             customers: List of customer dictionaries to process
@@ -249,89 +620,7 @@ class InsuranceDimensionLoader:
         Returns:
             Dict[str, int]: Mapping of customer_id to customer_key (surrogate key)
         """
-        # TODO: Implement customer batch processing logic here
-        # Remove this pass statement and add your implementation
-        surrogate_keys = {}
-
-        for customer in customers:
-            try:
-                check_sql = "SELECT customer_key FROM dim_customer WHERE customer_id = ?"
-                self.cursor.execute(check_sql, customer["customer_id"])
-                existing = self.cursor.fetchone()
-
-                if existing:
-                    # Record exists - update
-                    update_sql = """
-                        UPDATE dim_customer 
-                        SET first_name = ?, last_name = ?, full_name = ?, email = ?,
-                            phone = ?, birth_date = ?, age = ?, address = ?, city = ?,
-                            state = ?, risk_score = ?, risk_tier = ?, customer_since = ?,
-                            updated_date = GETDATE()
-                        WHERE customer_id = ?
-                        """
-                    self.cursor.execute(
-                        update_sql,
-                        (
-                            customer["first_name"],
-                            customer["last_name"],
-                            customer["full_name"],
-                            customer["email"],
-                            customer["phone"],
-                            customer["birth_date"],
-                            customer["age"],
-                            customer["address"],
-                            customer["city"],
-                            customer["state"],
-                            customer["risk_score"],
-                            customer["risk_tier"],
-                            customer["customer_since"],
-                            customer["customer_id"],
-                        ),
-                    )
-                    customer_key = existing[0]
-                else:
-                    # No record found - insert
-                    insert_sql = """
-                        INSERT INTO dim_customer (
-                            customer_id, first_name, last_name, full_name, email,
-                            phone, birth_date, age, address, city,
-                            state, risk_score, risk_tier, customer_since,
-                            updated_date
-                        )
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, GETDATE())
-                        """
-                    self.cursor.execute(
-                        insert_sql,
-                        (
-                            customer["customer_id"],
-                            customer["first_name"],
-                            customer["last_name"],
-                            customer["full_name"],
-                            customer["email"],
-                            customer["phone"],
-                            customer["birth_date"],
-                            customer["age"],
-                            customer["address"],
-                            customer["city"],
-                            customer["state"],
-                            customer["risk_score"],
-                            customer["risk_tier"],
-                            customer["customer_since"],
-                        )
-                    )
-                    self.cursor.execute("SELECT @@IDENTITY")
-                    customer_key = self.cursor.fetchone()[0]
-
-                    surrogate_keys[customer["customer_id"]] = customer_key
-
-            except Exception as e:
-                self.logger.warning(
-                    f"Error processing customer {customer.get('customer_id')}: {e}"
-                )
-                continue
-
-        return surrogate_keys
-
+        return self._upsert_dimension_batch("dim_customer", customers)
 
     def _process_policy_batch(self, policies: List[Dict[str, Any]]) -> Dict[str, int]:
         """
@@ -342,21 +631,6 @@ class InsuranceDimensionLoader:
         - Check existing policy_id, update if exists, insert if new
         - Return mapping of policy_id -> policy_key
 
-        IMPLEMENTATION STEPS:
-        1. Initialize empty surrogate_keys dictionary
-        2. For each policy in the batch:
-           a. Execute SELECT query to check if policy_id exists
-           b. If exists: Execute UPDATE query with new values
-           c. If new: Execute INSERT query and get generated surrogate key
-           d. Add policy_id -> policy_key mapping to dictionary
-        3. Return the surrogate_keys dictionary
-
-        SQL HINTS:
-        - Check existing: "SELECT policy_key FROM dim_policy WHERE policy_id = ?"
-        - Update: "UPDATE dim_policy SET policy_type = ?, ... WHERE policy_id = ?"
-        - Insert: "INSERT INTO dim_policy (...) VALUES (...)"
-        - Get surrogate key: "SELECT @@IDENTITY" (after INSERT)
-
         POLICY-SPECIFIC FIELDS:
         - policy_type, coverage_amount, annual_premium, premium_tier
         - deductible, effective_date, expiration_date, status
@@ -367,74 +641,7 @@ class InsuranceDimensionLoader:
         Returns:
             Dict[str, int]: Mapping of policy_id to policy_key (surrogate key)
         """
-        # TODO: Implement policy batch processing logic here
-        # Remove this pass statement and add your implementation
-        surrogate_keys = {}
-
-        for policy in policies:
-            try:
-                check_sql = "SELECT policy_key FROM dim_policy WHERE policy_id = ?"
-                self.cursor.execute(check_sql, policy["policy_id"])
-                existing = self.cursor.fetchone()
-
-                if existing:
-                    # Record exists - update
-                    update_sql = """
-                        UPDATE dim_policy 
-                        SET policy_type = ?, coverage_amount = ?, annual_premium = ?, premium_tier = ?
-                            deductible = ?, effective_date = ?, expiration_date = ?, status = ?, updated_date = GETDATE()
-                        WHERE policy_id = ?
-                        """
-                    self.cursor.execute(
-                        update_sql,
-                        (
-                            policy["policy_type"],
-                            policy["coverage_amount"],
-                            policy["annual_premium"],
-                            policy["premium_tier"],
-                            policy["deductible"],
-                            policy["effective_date"],
-                            policy["expiration_date"],
-                            policy["status"],
-                            policy["policy_id"],
-                        ),
-                    )
-                    policy_key = existing[0]
-                else:
-                    # No record found - insert
-                    insert_sql = """
-                        INSERT INTO dim_policy (
-                            policy_id, policy_type, coverage_amount, annual_premium, premium_tier,
-                            deductible, effective_date, expiration_date, status, updated_date
-                        )
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, GETDATE())
-                        """
-                    self.cursor.execute(
-                        insert_sql,
-                            (
-                                policy["policy_id"],
-                                policy["policy_type"],
-                                policy["coverage_amount"],
-                                policy["annual_premium"],
-                                policy["premium_tier"],
-                                policy["deductible"],
-                                policy["effective_date"],
-                                policy["expiration_date"],
-                                policy["status"]
-                            )
-                    )
-                    self.cursor.execute("SELECT @@IDENTITY")
-                    policy_key = self.cursor.fetchone()[0]
-
-                    surrogate_keys[policy["policy_id"]] = policy_key
-
-            except Exception as e:
-                self.logger.warning(
-                    f"Error processing policy {policy.get('policy_id')}: {e}"
-                )
-                continue
-
-        return surrogate_keys
+        return self._upsert_dimension_batch("dim_policy", policies)
 
     # =====================================================================
     # COMPLETED METHODS - ALREADY IMPLEMENTED (DO NOT MODIFY)
@@ -442,70 +649,139 @@ class InsuranceDimensionLoader:
 
     def _process_agent_batch(self, agents: List[Dict[str, Any]]) -> Dict[str, int]:
         """Process a batch of agent records for dimension loading"""
-        surrogate_keys = {}
+        return self._upsert_dimension_batch("dim_agent", agents)
+
+    def _upsert_dimension_batch(
+        self, table: str, records: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        Apply SCD Type 1 upserts for a batch of dimension records
 
-        for agent in agents:
+        The batch is sent as a few multi-row MERGE statements whose OUTPUT
+        clause returns the surrogate keys, so no separate lookup is needed.
+
+        Args:
+            table: Dimension table name (key of DIMENSIONS)
+            records: Transformed dimension records
+
+        Returns:
+            Dictionary mapping business key to surrogate key
+        """
+        if not records:
+            return {}
+
+        load_time = (self._load_time(),)
+        chunk_size = _merge_rows_per_statement(DIMENSIONS[table])
+        output_rows = []
+
+        # A savepoint lets a failed batch be undone without losing earlier ones
+        self.cursor.execute(SAVE_BATCH_SQL)
+
+        try:
+            params = [row + load_time for row in map(self._row_params[table], records)]
+            for i in range(0, len(params), chunk_size):
+                chunk = params[i : i + chunk_size]
+                self.cursor.execute(
+                    _build_multi_row_merge_sql(table, len(chunk)),
+                    list(chain.from_iterable(chunk)),
+                )
+                output_rows.extend(self._fetch_rows())
+        except ROW_ERRORS as e:
+            self.logger.warning(
+                f"Batch load of {table} failed, retrying row by row: {e}"
+            )
+            self.cursor.execute("ROLLBACK TRANSACTION dim_batch")
+            return self._upsert_dimension_rows(table, records, load_time[0])
+
+        return dict(output_rows)
+
+    def _upsert_dimension_rows(
+        self,
+        table: str,
+        records: List[Dict[str, Any]],
+        load_time: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        """
+        Apply SCD Type 1 upserts one record at a time, skipping bad records
+
+        Records hitting a constraint or holding invalid data are skipped.
+        Any other database error is raised so the caller rolls the load back.
+
+        Args:
+            table: Dimension table name (key of DIMENSIONS)
+            records: Transformed dimension records
+            load_time: Timestamp written to the record (defaults to now)
+
+        Returns:
+            Dictionary mapping business key to surrogate key
+        """
+        spec = DIMENSIONS[table]
+        business_key = spec["business_key"]
+        row_params = self._row_params[table]
+        merge_sql = self._merge_sql[table]
+        load_time = (load_time or self._load_time(),)
+        loaded_ids = []
+        failed = 0
+
+        for record in records:
             try:
-                # Check if agent exists
-                check_sql = "SELECT agent_key FROM dim_agent WHERE agent_id = ?"
-                self.cursor.execute(check_sql, (agent["agent_id"],))
-                existing = self.cursor.fetchone()
-
-                if existing:
-                    # Update existing agent (SCD Type 1)
-                    update_sql = """
-                    UPDATE dim_agent 
-                    SET first_name = ?, last_name = ?, full_name = ?, region = ?,
-                        experience_years = ?, hire_date = ?
-                    WHERE agent_id = ?
-                    """
-                    self.cursor.execute(
-                        update_sql,
-                        (
-                            agent["first_name"],
-                            agent["last_name"],
-                            agent["full_name"],
-                            agent["region"],
-                            agent["experience_years"],
-                            agent["hire_date"],
-                            agent["agent_id"],
-                        ),
-                    )
-                    agent_key = existing[0]
-                else:
-                    # Insert new agent
-                    insert_sql = """
-                    INSERT INTO dim_agent 
-                    (agent_id, first_name, last_name, full_name, region, 
-                     experience_years, hire_date, created_date, is_active)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, GETDATE(), 1)
-                    """
-                    self.cursor.execute(
-                        insert_sql,
-                        (
-                            agent["agent_id"],
-                            agent["first_name"],
-                            agent["last_name"],
-                            agent["full_name"],
-                            agent["region"],
-                            agent["experience_years"],
-                            agent["hire_date"],
-                        ),
+                params = row_params(record) + load_time
+                self.cursor.execute(merge_sql, params)
+                loaded_ids.append(params[0])
+
+            except ROW_ERRORS as e:
+                failed += 1
+                if failed <= MAX_LOGGED_ROW_ERRORS:
+                    self.logger.warning(
+                        f"Error processing {spec['entity']} {record.get(business_key)}: {e}"
                     )
 
-                    # Get the generated surrogate key
-                    self.cursor.execute("SELECT @@IDENTITY")
-                    agent_key = self.cursor.fetchone()[0]
+        if failed > MAX_LOGGED_ROW_ERRORS:
+            self.logger.warning(
+                f"{failed - MAX_LOGGED_ROW_ERRORS} more {spec['entity']} records "
+                f"failed to load into {table}"
+            )
 
-                surrogate_keys[agent["agent_id"]] = agent_key
+        return self._fetch_surrogate_keys(table, loaded_ids)
 
-            except Exception as e:
-                self.logger.warning(
-                    f"Error processing agent {agent.get('agent_id')}: {e}"
-                )
-                continue
+    def _fetch_surrogate_keys(self, table: str, ids: List[str]) -> Dict[str, int]:
+        """
+        Look up the surrogate keys of existing dimension records
 
-        return surrogate_keys
+        Args:
+            table: Dimension table name (key of DIMENSIONS)
+            ids: Business keys to look up
+
+        Returns:
+            Dictionary mapping business key to surrogate key for ids that exist
+        """
+        rows = []
+
+        # Keep each IN list under SQL Server's 2100 parameter limit
+        for i in range(0, len(ids), MAX_STATEMENT_PARAMS):
+            chunk = ids[i : i + MAX_STATEMENT_PARAMS]
+            self.cursor.execute(_build_key_lookup_sql(table, len(chunk)), chunk)
+            rows.extend(self._fetch_rows())
+
+        return dict(rows)
+
+    def _load_time(self) -> datetime:
+        """
+        Timestamp for created/updated dates, taken once per batch
+
+        Uses local time like the GETDATE() column defaults, truncated to the
+        millisecond so it binds cleanly to DATETIME columns.
+        """
+        now = datetime.now()
+        return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+    def _fetch_rows(self) -> Iterator[Any]:
+        """Yield the current result set, fetched cursor.arraysize rows at a time"""
+        while True:
+            rows = self.cursor.fetchmany()
+            if not rows:
+                return
+            yield from rows
 
     def validate_date_dimension(self, date_keys: List[int]) -> bool:
         """
@@ -524,23 +800,26 @@ class InsuranceDimensionLoader:
         self.logger.info(f"Validating {len(date_keys)} date keys in date dimension")
 
         try:
-            # Check which date keys exist
-            date_keys_str = ",".join(map(str, date_keys))
-            check_sql = f"""
-            SELECT date_key 
-            FROM dim_date 
-            WHERE date_key IN ({date_keys_str})
-            """
-
-            self.cursor.execute(check_sql)
-            existing_keys = {row[0] for row in self.cursor.fetchall()}
-
-            missing_keys = set(date_keys) - existing_keys
+            # Stage the required keys and let the server compute the missing ones
+            self.cursor.execute("CREATE TABLE #dk (date_key INT PRIMARY KEY)")
+            try:
+                self.cursor.executemany(
+                    "INSERT INTO #dk (date_key) VALUES (?)",
+                    [(date_key,) for date_key in set(date_keys)],
+                )
+                check_sql = """
+                SELECT date_key FROM #dk
+                EXCEPT
+                SELECT date_key FROM dim_date
+                ORDER BY date_key
+                """
+                self.cursor.execute(check_sql)
+                missing_keys = [row[0] for row in self._fetch_rows()]
+            finally:
+                self.cursor.execute("DROP TABLE #dk")
 
             if missing_keys:
-                self.logger.warning(
-                    f"Missing date keys in dimension: {sorted(list(missing_keys))}"
-                )
+                self.logger.warning(f"Missing date keys in dimension: {missing_keys}")
                 return False
 
             self.logger.info("All date keys validated successfully")
@@ -550,24 +829,66 @@ class InsuranceDimensionLoader:
             self.logger.error(f"Failed to validate date dimension: {str(e)}")
             return False
 
-    def _connect_to_database(self):
-        """Establish database connection"""
+    def _connect_to_database(self) -> Tuple[Any, Any]:
+        """
+        Establish database connection
+
+        Returns:
+            Tuple of (connection, cursor)
+        """
         try:
             connection_string = self.config.get_connection_string()
-            self.connection = pyodbc.connect(connection_string)
-            self.connection.autocommit = False  # Use transactions
-            self.cursor = self.connection.cursor()
+            connection = pyodbc.connect(
+                connection_string, attrs_before=self.config.get_connection_attributes()
+            )
+            connection.autocommit = False  # Use transactions
+            connection.timeout = self.config.db_query_timeout
+            cursor = connection.cursor()
+            cursor.fast_executemany = True  # Send executemany as one array
+            cursor.arraysize = FETCH_SIZE  # Rows per fetchmany() call
             self.logger.info(f"Connected to database: {self.config.db_name}")
+            return connection, cursor
         except Exception as e:
             raise ConnectionError(f"Failed to connect to database: {str(e)}")
 
-    def _cleanup_connection(self):
+    def _use_new_connection(self):
+        """Open a connection for the current thread and track it for cleanup"""
+        connection, cursor = self._connect_to_database()
+        self._local.connection = connection
+        self._local.cursor = cursor
+        with self._connections_lock:
+            self._connections.append((connection, cursor))
+
+    def _cleanup_connection(self, connection, cursor, commit: bool = True):
         """Clean up database connection"""
-        if self.cursor:
-            self.cursor.close()
-        if self.connection:
-            self.connection.commit()  # Commit successful operations
-            self.connection.close()
+        if cursor:
+            cursor.close()
+        if connection:
+            if commit:
+                connection.commit()  # Commit successful operations
+            else:
+                connection.rollback()
+            connection.close()
+
+    def _cleanup_connections(self, commit: bool):
+        """Commit or roll back, then close, every connection opened by this loader"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+
+        for connection, cursor in connections:
+            if (connection, cursor) == self._persistent:
+                # Keep the with-block connection open, just end its transaction
+                if commit:
+                    connection.commit()
+                else:
+                    connection.rollback()
+                with self._connections_lock:
+                    self._connections.append((connection, cursor))
+            else:
+                self._cleanup_connection(connection, cursor, commit=commit)
+
+        if self._persistent is None:
+            self._local = threading.local()
 
 
 def load_insurance_dimensions(
@@ -596,8 +917,6 @@ if __name__ == "__main__":
         print("=" * 40)
 
         config = load_config()
-        loader = InsuranceDimensionLoader(config)
-
         # Test with sample data
         sample_data = {
             "dim_customer": [
@@ -616,7 +935,24 @@ if __name__ == "__main__":
                     "risk_score": 2.1,
                     "risk_tier": "Medium",
                     "customer_since": "2015-01-01",
-                }
+                },
+                {
+                    # Same customer again: updated values, same surrogate key
+                    "customer_id": "CUST001",
+                    "first_name": "John",
+                    "last_name": "Doe",
+                    "full_name": "John Doe",
+                    "email": "john.doe@example.org",
+                    "phone": "(555) 123-4567",
+                    "birth_date": "1985-03-15",
+                    "age": 39,
+                    "address": "456 Oak Ave",
+                    "city": "Anytown",
+                    "state": "CA",
+                    "risk_score": 2.1,
+                    "risk_tier": "Medium",
+                    "customer_since": "2015-01-01",
+                },
             ],
             "dim_policy": [],
             "dim_agent": [],
@@ -624,12 +960,17 @@ if __name__ == "__main__":
         }
 
         print("Testing dimension loading with sample data...")
-        surrogate_keys = loader.load_all_dimensions(sample_data)
+        with InsuranceDimensionLoader(config) as loader:
+            surrogate_keys = loader.load_all_dimensions(sample_data)
 
         print("Dimension Loading Results:")
         for dim_name, mappings in surrogate_keys.items():
             print(f"  - {dim_name}: {len(mappings)} records")
 
+        # The repeated customer must still map to its surrogate key
+        assert "CUST001" in surrogate_keys["dim_customer"], "CUST001 key missing"
+        print(f"  - CUST001 -> {surrogate_keys['dim_customer']['CUST001']}")
+
     except Exception as e:
         print(f"Dimension loading test failed: {e}")
         print("Ensure database schema is created and accessible!")
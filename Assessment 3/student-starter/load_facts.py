@@ -23,12 +23,156 @@ Target Audience: Beginner/Intermediate students
 Complexity Level: MEDIUM (~150 lines of code, 1 TODO method for students)
 """
 
+import csv
+import threading
 import pyodbc
 import logging
-from typing import List, Dict, Any, Optional, Set
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from operator import itemgetter
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 from datetime import datetime, date
 from config import InsuranceETLConfig
 
+# fact_claims columns supplied by the loader, in INSERT parameter order
+CLAIM_FACT_COLUMNS = (
+    "claim_id",
+    "customer_key",
+    "policy_key",
+    "agent_key",
+    "filed_date_key",
+    "closed_date_key",
+    "claim_amount",
+    "coverage_amount",
+    "deductible_amount",
+    "payout_amount",
+    "processing_days",
+    "claim_status",
+)
+
+# created_date is left to the column default
+INSERT_CLAIM_FACT_SQL = (
+    f"INSERT INTO fact_claims ({', '.join(CLAIM_FACT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(CLAIM_FACT_COLUMNS))})"
+)
+
+# Load a batch of resolved claims passed as one dbo.ClaimFactTVP table-valued
+# parameter (rows in CLAIM_FACT_COLUMNS order)
+LOAD_CLAIMS_TVP_SQL = "{CALL dbo.sp_LoadFactClaims (?)}"
+
+# Staged claim columns: the claim's business keys instead of surrogate keys
+CLAIM_STAGE_COLUMNS = (
+    "claim_id",
+    "customer_id",
+    "policy_id",
+    "agent_id",
+    "filed_date_key",
+    "closed_date_key",
+    "claim_amount",
+    "coverage_amount",
+    "deductible_amount",
+    "payout_amount",
+    "processing_days",
+    "claim_status",
+)
+
+CREATE_CLAIM_STAGE_SQL = """
+CREATE TABLE #stg_claims (
+    claim_id VARCHAR(50) NOT NULL,
+    customer_id VARCHAR(50),
+    policy_id VARCHAR(50),
+    agent_id VARCHAR(50),
+    filed_date_key INT,
+    closed_date_key INT,
+    claim_amount DECIMAL(12,2),
+    coverage_amount DECIMAL(12,2),
+    deductible_amount DECIMAL(10,2),
+    payout_amount DECIMAL(12,2),
+    processing_days INT,
+    claim_status VARCHAR(20)
+)
+"""
+
+INSERT_CLAIM_STAGE_SQL = (
+    f"INSERT INTO #stg_claims ({', '.join(CLAIM_STAGE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(CLAIM_STAGE_COLUMNS))})"
+)
+
+# Resolve the surrogate keys with joins on the dimensions' business keys, skip
+# claims already in the fact table and return the number of claims inserted
+INSERT_STAGED_CLAIMS_SQL = f"""
+INSERT INTO fact_claims ({', '.join(CLAIM_FACT_COLUMNS)})
+SELECT s.claim_id, c.customer_key, p.policy_key, a.agent_key, s.filed_date_key,
+    CASE WHEN s.closed_date_key > 0 THEN s.closed_date_key END,
+    s.claim_amount, s.coverage_amount, s.deductible_amount, s.payout_amount,
+    s.processing_days, s.claim_status
+FROM #stg_claims s
+INNER JOIN dim_customer c ON c.customer_id = s.customer_id
+INNER JOIN dim_policy p ON p.policy_id = s.policy_id
+INNER JOIN dim_agent a ON a.agent_id = s.agent_id
+WHERE s.filed_date_key <> 0
+    AND NOT EXISTS (SELECT 1 FROM fact_claims f WHERE f.claim_id = s.claim_id);
+SELECT @@ROWCOUNT
+"""
+
+# Staged claims that are already in the fact table
+DUPLICATE_STAGED_CLAIMS_SQL = """
+SELECT s.claim_id FROM #stg_claims s
+WHERE EXISTS (SELECT 1 FROM fact_claims f WHERE f.claim_id = s.claim_id)
+"""
+
+# New staged claims the INSERT above skips, with the reference that is missing
+INVALID_STAGED_CLAIMS_SQL = """
+SELECT s.claim_id, s.customer_id, c.customer_key, s.policy_id, p.policy_key,
+    s.agent_id, a.agent_key, s.filed_date_key
+FROM #stg_claims s
+LEFT JOIN dim_customer c ON c.customer_id = s.customer_id
+LEFT JOIN dim_policy p ON p.policy_id = s.policy_id
+LEFT JOIN dim_agent a ON a.agent_id = s.agent_id
+WHERE (c.customer_key IS NULL OR p.policy_key IS NULL OR a.agent_key IS NULL
+        OR s.filed_date_key IS NULL OR s.filed_date_key = 0)
+    AND NOT EXISTS (SELECT 1 FROM fact_claims f WHERE f.claim_id = s.claim_id)
+"""
+
+# Incoming claim IDs, staged to find the ones already in the fact table
+CREATE_INCOMING_CLAIMS_SQL = (
+    "CREATE TABLE #incoming_claims (claim_id VARCHAR(50) PRIMARY KEY)"
+)
+
+INSERT_INCOMING_CLAIM_SQL = "INSERT INTO #incoming_claims (claim_id) VALUES (?)"
+
+EXISTING_INCOMING_CLAIMS_SQL = """
+SELECT claim_id FROM #incoming_claims
+INTERSECT
+SELECT claim_id FROM fact_claims
+"""
+
+# Savepoint statement (format with the savepoint name). SAVE TRANSACTION
+# needs an active transaction, which a new connection or one just committed
+# does not have; BEGIN TRANSACTION opens one, and the level it nests when the
+# driver's implicit transactions open another is committed again at once.
+SAVEPOINT_SQL = (
+    "IF @@TRANCOUNT = 0 BEGIN "
+    "BEGIN TRANSACTION; IF @@TRANCOUNT > 1 COMMIT TRANSACTION; "
+    "END; "
+    "SAVE TRANSACTION {}"
+)
+
+# Rows fetched per round trip when reading claim IDs back from the server
+FETCH_SIZE = 10000
+
+# Loads of at least this many claims disable the fact indexes in bulk load mode
+BULK_LOAD_MIN_ROWS = 10000
+
+# Enabled non-unique nonclustered indexes on fact_claims; the UNIQUE claim_id
+# index stays on so duplicate claims are still rejected during the load
+FACT_INDEXES_SQL = """
+SELECT name FROM sys.indexes
+WHERE object_id = OBJECT_ID('fact_claims') AND type_desc = 'NONCLUSTERED'
+    AND is_unique = 0 AND is_disabled = 0
+"""
+
 
 class InsuranceFactLoader:
     """
@@ -47,8 +191,24 @@ class InsuranceFactLoader:
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.connection = None
-        self.cursor = None
+        # Each thread works on its own connection and cursor
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        # Serializes workers taking batches from the shared claim stream
+        self._batches_lock = threading.Lock()
+        # INSERT parameter row for a staged claim
+        self._stage_params = itemgetter(*CLAIM_STAGE_COLUMNS)
+
+    @property
+    def connection(self):
+        """Database connection used by the current thread"""
+        return getattr(self._local, "connection", None)
+
+    @property
+    def cursor(self):
+        """Database cursor used by the current thread"""
+        return getattr(self._local, "cursor", None)
 
     def load_all_facts(
         self,
@@ -58,6 +218,11 @@ class InsuranceFactLoader:
         """
         Load all fact tables with surrogate key resolution
 
+        Each connection commits every commit_every_n_batches batches, so a
+        failed load rolls back only the work since the last commit. Claims
+        already in fact_claims are skipped, so re-running after a failure
+        loads just the missing ones.
+
         Args:
             facts_data: List of transformed fact records
             surrogate_key_mappings: Dictionary containing surrogate key mappings from dimensions
@@ -75,11 +240,18 @@ class InsuranceFactLoader:
             Exception: If fact loading fails
         """
         self.logger.info(f"Starting fact loading with {len(facts_data)} claims")
+        succeeded = False
+        disabled_indexes = []
 
         try:
             # Connect to database
             self._connect_to_database()
 
+            # Large bulk loads build the nonclustered indexes once at the end
+            # instead of maintaining them for every inserted claim
+            if self.config.bulk_load_mode and len(facts_data) >= BULK_LOAD_MIN_ROWS:
+                disabled_indexes = self._disable_fact_indexes()
+
             # Load claims facts
             loading_stats = self.load_claims_facts(facts_data, surrogate_key_mappings)
 
@@ -96,15 +268,24 @@ class InsuranceFactLoader:
                 f"  - Duplicates found: {loading_stats['duplicate_claims']}"
             )
 
+            succeeded = True
             return loading_stats
 
         except Exception as e:
             self.logger.error(f"Failed to load facts: {str(e)}")
-            if self.connection:
-                self.connection.rollback()
             raise
         finally:
-            self._cleanup_connection()
+            # Commit the rest of every connection's work, or roll back what
+            # has not been committed; periodically committed batches stay
+            # loaded, and a re-run skips those claims as existing ones
+            self._cleanup_connection(commit=succeeded)
+            if disabled_indexes:
+                try:
+                    self._rebuild_fact_indexes(disabled_indexes)
+                except Exception:
+                    # Already logged; a failed load keeps its own error
+                    if succeeded:
+                        raise
 
     def load_claims_facts(
         self,
@@ -130,28 +311,57 @@ class InsuranceFactLoader:
         """
         self.logger.info(f"Loading claims facts with {len(claims)} records")
 
-        stats = {
-            "total_processed": 0,
-            "successfully_loaded": 0,
-            "failed_validation": 0,
-            "duplicate_claims": 0,
-        }
-
         try:
+            # Large loads resolve surrogate keys and skip existing claims on
+            # the server in one statement
+            if len(claims) > self.config.bulk_load_threshold:
+                try:
+                    stats = self._load_claims_via_staging(claims)
+                except pyodbc.Error as e:
+                    self.logger.warning(
+                        f"Staged load of claims failed, loading in batches: {e}"
+                    )
+                else:
+                    self.logger.info(
+                        f"Successfully processed {stats['total_processed']} claims"
+                    )
+                    return stats
+
             # Get existing claim IDs to detect duplicates
-            existing_claims = self._get_existing_claim_ids()
-
-            # Process claims in batches for performance
-            batch_size = self.config.batch_size
-            for i in range(0, len(claims), batch_size):
-                batch = claims[i : i + batch_size]
-                batch_stats = self._process_claims_batch(
-                    batch, surrogate_key_mappings, existing_claims
-                )
+            existing_claims = self._get_existing_claim_ids(
+                {claim["claim_id"] for claim in claims if "claim_id" in claim}
+            )
+
+            # Resolve every claim's surrogate keys in one vectorized pass
+            resolved_claims, stats = self._resolve_claims(
+                claims, surrogate_key_mappings, existing_claims
+            )
+
+            # Insert in batches for performance, spread across connections
+            # when there is more than one batch
+            resolved_count = (
+                stats["total_processed"]
+                - stats["failed_validation"]
+                - stats["duplicate_claims"]
+            )
+            batch_count = -(-resolved_count // self.config.batch_size)
+            workers = min(self.config.loader_parallelism, batch_count)
+            if workers > 1:
+                # Release this connection's locks before the workers insert
+                self.connection.commit()
+
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(self._load_claims_shard, resolved_claims, True)
+                        for _ in range(workers)
+                    ]
+                    results = [future.result() for future in futures]
+            else:
+                results = [self._load_claims_shard(resolved_claims)]
 
-                # Update overall statistics
-                for key, value in batch_stats.items():
-                    stats[key] += value
+            for loaded, failed in results:
+                stats["successfully_loaded"] += loaded
+                stats["failed_validation"] += failed
 
             self.logger.info(
                 f"Successfully processed {stats['total_processed']} claims"
@@ -162,157 +372,370 @@ class InsuranceFactLoader:
             self.logger.error(f"Failed to load claims facts: {str(e)}")
             raise
 
-    def _process_claims_batch(
-        self,
-        claims: List[Dict[str, Any]],
-        surrogate_key_mappings: Dict[str, Dict[str, int]],
-        existing_claims: Set[str],
-    ) -> Dict[str, int]:
+    def _load_claims_shard(
+        self, resolved_claims: Iterator[Tuple], worker: bool = False
+    ) -> Tuple[int, int]:
         """
-        Process a batch of claims records for fact loading
+        Insert resolved claims batch by batch on the current thread's connection
+
+        Concurrent workers share one stream of resolved claims, each taking
+        the next batch when it is ready for more.
 
         Args:
-            claims: Batch of claims records
-            surrogate_key_mappings: Surrogate key mappings
-            existing_claims: Set of existing claim IDs
+            resolved_claims: Stream of resolved claim rows in CLAIM_FACT_COLUMNS order
+            worker: True when running on a worker thread (opens a connection)
 
         Returns:
-            Dictionary containing batch statistics
+            Tuple of (loaded, failed) record counts
         """
-        batch_stats = {
-            "total_processed": 0,
+        if worker:
+            self._connect_to_database()
+
+        loaded = failed = 0
+
+        batches = iter(lambda: self._take_claims_batch(resolved_claims), [])
+        for batch_number, batch in enumerate(batches, 1):
+            batch_loaded, batch_failed = self._load_claims_batch(batch)
+            loaded += batch_loaded
+            failed += batch_failed
+
+            # Bound the work lost (and the log held) if a later batch fails
+            if batch_number % self.config.commit_every_n_batches == 0:
+                self.connection.commit()
+
+        return loaded, failed
+
+    def _take_claims_batch(self, resolved_claims: Iterator[Tuple]) -> List[Tuple]:
+        """
+        Take the next batch of resolved claims from a shared stream
+
+        Args:
+            resolved_claims: Stream of resolved claim rows
+
+        Returns:
+            Up to batch_size claim rows (empty once the stream is exhausted)
+        """
+        with self._batches_lock:
+            return list(islice(resolved_claims, self.config.batch_size))
+
+    def _load_claims_batch(self, resolved_claims: List[Tuple]) -> Tuple[int, int]:
+        """
+        Insert resolved claim records with a single stored procedure call
+
+        If the batch fails it is undone and split in half until the bad
+        records are isolated, so one bad record does not lose the rest of
+        the batch.
+
+        Args:
+            resolved_claims: Resolved claim rows in CLAIM_FACT_COLUMNS order
+
+        Returns:
+            Tuple of (loaded, failed) record counts
+        """
+        loaded = self._insert_claims_with_bisect(resolved_claims)
+        return loaded, len(resolved_claims) - loaded
+
+    def _insert_claims_with_bisect(self, resolved_claims: List[Tuple]) -> int:
+        """
+        Insert claims as one table-valued parameter, bisecting a batch that fails
+
+        Args:
+            resolved_claims: Resolved claim rows in CLAIM_FACT_COLUMNS order
+
+        Returns:
+            Number of claims inserted
+        """
+        if not resolved_claims:
+            return 0
+        if len(resolved_claims) == 1:
+            # Isolated record: insert it on its own and log it if it fails
+            return int(self._load_single_claim_fact(resolved_claims[0]))
+
+        # A savepoint lets a failed batch be undone without losing earlier ones
+        self.cursor.execute(SAVEPOINT_SQL.format("fact_batch"))
+
+        try:
+            self.cursor.execute(LOAD_CLAIMS_TVP_SQL, (resolved_claims,))
+            return len(resolved_claims)
+        except pyodbc.DatabaseError as e:
+            self.logger.warning(
+                f"Insert of {len(resolved_claims)} claims failed, "
+                f"splitting the batch: {e}"
+            )
+            self.cursor.execute("ROLLBACK TRANSACTION fact_batch")
+
+        middle = len(resolved_claims) // 2
+        loaded = self._insert_claims_with_bisect(resolved_claims[:middle])
+        return loaded + self._insert_claims_with_bisect(resolved_claims[middle:])
+
+    def _load_claims_via_staging(self, claims: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Stage claims in a temp table and insert them with one INSERT ... SELECT
+
+        Surrogate keys are resolved by joining the staged business keys to the
+        dimension tables on the server, so claims are not resolved one by one,
+        and claims already in the fact table are skipped there too.
+
+        Args:
+            claims: Transformed claims fact records
+
+        Returns:
+            Dictionary containing loading statistics
+        """
+        stats = {
+            "total_processed": len(claims),
             "successfully_loaded": 0,
             "failed_validation": 0,
             "duplicate_claims": 0,
         }
+        staged_claims = set()
+        rows = []
 
         for claim in claims:
-            batch_stats["total_processed"] += 1
-
             try:
-                # Check for duplicate claim
-                if claim["claim_id"] in existing_claims:
-                    batch_stats["duplicate_claims"] += 1
-                    self.logger.warning(f"Duplicate claim found: {claim['claim_id']}")
+                claim_id = claim["claim_id"]
+                if claim_id in staged_claims:
+                    stats["duplicate_claims"] += 1
+                    self.logger.warning("Duplicate claim found: %s", claim_id)
                     continue
 
-                # Resolve surrogate keys
-                resolved_claim = self._resolve_surrogate_keys(
-                    claim, surrogate_key_mappings
+                rows.append(self._stage_params(claim))
+                staged_claims.add(claim_id)
+
+            except KeyError as e:
+                stats["failed_validation"] += 1
+                self.logger.warning(
+                    "Error processing claim %s: missing %s", claim.get("claim_id"), e
                 )
 
-                if not resolved_claim:
-                    batch_stats["failed_validation"] += 1
-                    continue
+        self.logger.info(f"Staging {len(rows)} claims for a set-based insert")
 
-                # Load the fact record
-                success = self._load_single_claim_fact(resolved_claim)
+        # A savepoint lets a failed staged load be undone before the batch path
+        self.cursor.execute(SAVEPOINT_SQL.format("fact_stage"))
 
-                if success:
-                    batch_stats["successfully_loaded"] += 1
-                    existing_claims.add(claim["claim_id"])  # Track for duplicates
-                else:
-                    batch_stats["failed_validation"] += 1
+        try:
+            self.cursor.execute(CREATE_CLAIM_STAGE_SQL)
+            self._fill_claim_stage(rows)
+
+            self.cursor.execute(DUPLICATE_STAGED_CLAIMS_SQL)
+            duplicates = 0
+            for row in self._fetch_rows():
+                duplicates += 1
+                self.logger.warning("Duplicate claim found: %s", row.claim_id)
+
+            self._log_invalid_staged_claims()
+            self.cursor.execute(INSERT_STAGED_CLAIMS_SQL)
+            loaded = self.cursor.fetchone()[0]
+            self.cursor.execute("DROP TABLE #stg_claims")
+        except pyodbc.Error:
+            self.cursor.execute("ROLLBACK TRANSACTION fact_stage")
+            raise
+
+        stats["successfully_loaded"] = loaded
+        stats["duplicate_claims"] += duplicates
+        stats["failed_validation"] += len(rows) - loaded - duplicates
+        return stats
 
-            except Exception as e:
-                batch_stats["failed_validation"] += 1
+    def _fill_claim_stage(self, rows: List[Tuple]):
+        """
+        Insert staged claim rows into #stg_claims
+
+        Very large loads are written to a CSV file in bulk_load_dir and read
+        with BULK INSERT; otherwise, or if that fails, the rows are sent with
+        executemany.
+
+        Args:
+            rows: Claim parameter rows in CLAIM_STAGE_COLUMNS order
+        """
+        if (
+            self.config.bulk_load_dir
+            and len(rows) > self.config.fact_bulk_insert_threshold
+        ):
+            try:
+                self._bulk_insert_claim_stage(rows)
+                return
+            except (pyodbc.Error, OSError) as e:
                 self.logger.warning(
-                    f"Error processing claim {claim.get('claim_id')}: {e}"
+                    f"Bulk insert of staged claims failed, inserting rows: {e}"
                 )
-                continue
 
-        return batch_stats
+        batch_size = self.config.batch_size
+        for i in range(0, len(rows), batch_size):
+            self.cursor.executemany(INSERT_CLAIM_STAGE_SQL, rows[i : i + batch_size])
 
-    def _resolve_surrogate_keys(
-        self, claim: Dict[str, Any], surrogate_key_mappings: Dict[str, Dict[str, int]]
-    ) -> Optional[Dict[str, Any]]:
+    def _bulk_insert_claim_stage(self, rows: List[Tuple]):
+        """
+        Load staged claim rows into #stg_claims from a CSV file with BULK INSERT
+
+        Args:
+            rows: Claim parameter rows in CLAIM_STAGE_COLUMNS order
+        """
+        self.logger.info(f"Bulk inserting {len(rows)} claims into #stg_claims")
+
+        with bulk_load_file(
+            self.config, lambda stage_file: csv.writer(stage_file).writerows(rows)
+        ) as path:
+            self.cursor.execute(
+                f"BULK INSERT #stg_claims FROM {path} "
+                "WITH (FORMAT = 'CSV', CODEPAGE = '65001', KEEPNULLS, TABLOCK, "
+                "BATCHSIZE = 50000)"
+            )
+
+    def _log_invalid_staged_claims(self):
+        """Log the staged claims that have a missing reference or filed date"""
+        self.cursor.execute(INVALID_STAGED_CLAIMS_SQL)
+
+        for row in self._fetch_rows():
+            if row.customer_key is None:
+                self.logger.warning(
+                    "Missing customer reference for claim %s: %s",
+                    row.claim_id,
+                    row.customer_id,
+                )
+            elif row.policy_key is None:
+                self.logger.warning(
+                    "Missing policy reference for claim %s: %s",
+                    row.claim_id,
+                    row.policy_id,
+                )
+            elif row.agent_key is None:
+                self.logger.warning(
+                    "Missing agent reference for claim %s: %s",
+                    row.claim_id,
+                    row.agent_id,
+                )
+            else:
+                self.logger.warning("Invalid filed_date_key for claim %s", row.claim_id)
+
+    def _resolve_claims(
+        self,
+        claims: List[Dict[str, Any]],
+        surrogate_key_mappings: Dict[str, Dict[str, int]],
+        existing_claims: Set[str],
+    ) -> Tuple[Iterator[Tuple], Dict[str, int]]:
         """
         Resolve business keys to surrogate keys for fact loading
 
+        All claims are resolved together with vectorized pandas lookups
+        instead of a chain of dictionary lookups per claim.
+
         Args:
-            claim: Original claim record with business keys
+            claims: Original claim records with business keys
             surrogate_key_mappings: Mappings from dimension loading
+            existing_claims: Set of existing claim IDs
 
         Returns:
-            Claim record with surrogate keys, or None if validation fails
+            Tuple of (stream of claim rows with surrogate keys in
+            CLAIM_FACT_COLUMNS order, loading statistics for the claims that
+            were skipped)
 
         Business Rules:
         - All required foreign keys must resolve to valid surrogate keys
         - Missing dimension references should cause record rejection
         - Log warnings for missing references but continue processing
+        - Claims already in the fact table, and repeats of a claim being
+          loaded, are counted as duplicates
         """
-        try:
-            # Resolve customer surrogate key
-            customer_key = surrogate_key_mappings.get("dim_customer", {}).get(
-                claim["customer_id"]
-            )
-            if not customer_key:
+        df = pd.DataFrame(claims, columns=list(CLAIM_STAGE_COLUMNS))
+
+        # Resolve the surrogate keys (NaN where the reference is missing)
+        for dimension, business_key, surrogate_key in (
+            ("dim_customer", "customer_id", "customer_key"),
+            ("dim_policy", "policy_id", "policy_key"),
+            ("dim_agent", "agent_id", "agent_key"),
+        ):
+            mapping = surrogate_key_mappings.get(dimension, {})
+            df[surrogate_key] = df[business_key].map(mapping)
+
+        # Validate date keys exist (they should be in dim_date already)
+        filed_date_key = df["filed_date_key"]
+        valid = (
+            df["claim_id"].notna()
+            & df[["customer_key", "policy_key", "agent_key"]].notna().all(axis=1)
+            & filed_date_key.notna()
+            & (filed_date_key != 0)
+        )
+
+        # The first valid occurrence of a new claim is loaded; existing claims
+        # and any later occurrence of a loaded claim are duplicates
+        claim_ids = df["claim_id"]
+        in_fact_table = claim_ids.isin(existing_claims)
+        loadable = valid & ~in_fact_table
+        first_loaded = pd.Series(df.index[loadable], index=claim_ids[loadable])
+        first_loaded = first_loaded[~first_loaded.index.duplicated()]
+        duplicate = in_fact_table | (claim_ids.map(first_loaded) < df.index)
+        invalid = ~valid & ~duplicate
+
+        # Walking the rejected rows is skipped entirely when warnings are off
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log_rejected_claims(df, duplicate, invalid)
+
+        # Closed date keys of 0 (open claims) are stored as NULL
+        closed_date_key = df["closed_date_key"]
+        df["closed_date_key"] = closed_date_key.where(closed_date_key > 0)
+
+        # Insert in filed date order so the filed_date_key index is appended
+        # to rather than split all over
+        rows = df.loc[valid & ~duplicate, list(CLAIM_FACT_COLUMNS)]
+        rows = rows.sort_values(["filed_date_key", "claim_id"])
+
+        # Back to plain Python values (None for missing) for the driver
+        rows = rows.convert_dtypes()
+        rows = rows.astype(object).where(rows.notna(), None)
+
+        stats = {
+            "total_processed": len(df),
+            "successfully_loaded": 0,
+            "failed_validation": int(invalid.sum()),
+            "duplicate_claims": int(duplicate.sum()),
+        }
+        # Rows are produced as they are inserted rather than built up front
+        return rows.itertuples(index=False, name=None), stats
+
+    def _log_rejected_claims(
+        self, df: pd.DataFrame, duplicate: pd.Series, invalid: pd.Series
+    ):
+        """
+        Log a warning for every duplicate or invalid claim in a resolved frame
+
+        Args:
+            df: Claims with their resolved surrogate keys
+            duplicate: Mask of the duplicate claims
+            invalid: Mask of the claims that failed validation
+        """
+        for claim_id in df["claim_id"][duplicate]:
+            self.logger.warning("Duplicate claim found: %s", claim_id)
+        for claim in df[invalid].itertuples(index=False):
+            if pd.isna(claim.claim_id):
+                self.logger.warning("Error processing claim None: missing claim_id")
+            elif pd.isna(claim.customer_key):
                 self.logger.warning(
-                    f"Missing customer reference for claim {claim['claim_id']}: {claim['customer_id']}"
+                    "Missing customer reference for claim %s: %s",
+                    claim.claim_id,
+                    claim.customer_id,
                 )
-                return None
-
-            # Resolve policy surrogate key
-            policy_key = surrogate_key_mappings.get("dim_policy", {}).get(
-                claim["policy_id"]
-            )
-            if not policy_key:
+            elif pd.isna(claim.policy_key):
                 self.logger.warning(
-                    f"Missing policy reference for claim {claim['claim_id']}: {claim['policy_id']}"
+                    "Missing policy reference for claim %s: %s",
+                    claim.claim_id,
+                    claim.policy_id,
                 )
-                return None
-
-            # Resolve agent surrogate key
-            agent_key = surrogate_key_mappings.get("dim_agent", {}).get(
-                claim["agent_id"]
-            )
-            if not agent_key:
+            elif pd.isna(claim.agent_key):
                 self.logger.warning(
-                    f"Missing agent reference for claim {claim['claim_id']}: {claim['agent_id']}"
+                    "Missing agent reference for claim %s: %s",
+                    claim.claim_id,
+                    claim.agent_id,
                 )
-                return None
-
-            # Validate date keys exist (they should be in dim_date already)
-            filed_date_key = claim["filed_date_key"]
-            closed_date_key = claim["closed_date_key"]
-
-            if not filed_date_key or filed_date_key == 0:
+            else:
                 self.logger.warning(
-                    f"Invalid filed_date_key for claim {claim['claim_id']}"
+                    "Invalid filed_date_key for claim %s", claim.claim_id
                 )
-                return None
-
-            # Create resolved claim record
-            resolved_claim = {
-                "claim_id": claim["claim_id"],
-                "customer_key": customer_key,
-                "policy_key": policy_key,
-                "agent_key": agent_key,
-                "filed_date_key": filed_date_key,
-                "closed_date_key": (
-                    closed_date_key if closed_date_key and closed_date_key > 0 else None
-                ),
-                "claim_amount": claim["claim_amount"],
-                "coverage_amount": claim["coverage_amount"],
-                "deductible_amount": claim["deductible_amount"],
-                "payout_amount": claim["payout_amount"],
-                "processing_days": claim["processing_days"],
-                "claim_status": claim["claim_status"],
-            }
-
-            return resolved_claim
-
-        except Exception as e:
-            self.logger.warning(
-                f"Error resolving surrogate keys for claim {claim.get('claim_id')}: {e}"
-            )
-            return None
 
     # =====================================================================
     # STUDENT TODO METHOD - IMPLEMENT THIS!
     # =====================================================================
 
-    def _load_single_claim_fact(self, resolved_claim: Dict[str, Any]) -> bool:
+    def _load_single_claim_fact(self, resolved_claim: Tuple) -> bool:
         """
         TODO: Load a single resolved claim record into the fact table
 
@@ -342,14 +765,14 @@ class InsuranceFactLoader:
         - payout_amount (decimal)
         - processing_days (integer)
         - claim_status (varchar)
-        - created_date (datetime, auto-generated)
+        - created_date (datetime, filled by the column default)
 
         SQL TEMPLATE:
         INSERT INTO fact_claims
         (claim_id, customer_key, policy_key, agent_key, filed_date_key,
          closed_date_key, claim_amount, coverage_amount, deductible_amount,
-         payout_amount, processing_days, claim_status, created_date)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, GETDATE())
+         payout_amount, processing_days, claim_status)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
 
         EXCEPTION HANDLING:
         - Use try/except block to catch database errors
@@ -357,7 +780,7 @@ class InsuranceFactLoader:
         - Return False if any exception occurs
 
         Args:
-            resolved_claim: Dictionary with all surrogate keys resolved
+            resolved_claim: Resolved claim values in CLAIM_FACT_COLUMNS order
 
         Returns:
             bool: True if record loaded successfully, False if failed
@@ -365,51 +788,50 @@ class InsuranceFactLoader:
         # TODO: Implement fact record loading logic here
         # Remove this pass statement and add your implementation
         try:
-            insert_sql = """
-                INSERT INTO fact_claims
-                    (claim_id, customer_key, policy_key, agent_key, filed_date_key,
-                    closed_date_key, claim_amount, coverage_amount, deductible_amount,
-                    payout_amount, processing_days, claim_status, created_date)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, GETDATE())
-                """
-            
-            self.cursor.execute(
-                insert_sql,
-                (
-                    resolved_claim["claim_id"],
-                    resolved_claim["customer_key"],
-                    resolved_claim["policy_key"],
-                    resolved_claim["agent_key"],
-                    resolved_claim["filed_date_key"],
-                    resolved_claim["closed_date_key"],
-                    resolved_claim["claim_amount"],
-                    resolved_claim["coverage_amount"],
-                    resolved_claim["deductible_amount"],
-                    resolved_claim["payout_amount"],
-                    resolved_claim["processing_days"],
-                    resolved_claim["claim_status"]
-                )
-            )
+            self.cursor.execute(INSERT_CLAIM_FACT_SQL, resolved_claim)
 
             return True
         except pyodbc.DatabaseError as e:
-            self.logger.warning(f"Error occurred inserting claim fact {resolved_claim}: {e}")
+            claim_fact = dict(zip(CLAIM_FACT_COLUMNS, resolved_claim))
+            self.logger.warning(
+                "Error occurred inserting claim fact %s: %s", claim_fact, e
+            )
             return False
 
     # =====================================================================
     # COMPLETED METHODS - ALREADY IMPLEMENTED (DO NOT MODIFY)
     # =====================================================================
 
-    def _get_existing_claim_ids(self) -> Set[str]:
+    def _get_existing_claim_ids(self, claim_ids: Optional[Set[str]] = None) -> Set[str]:
         """
         Get set of existing claim IDs to detect duplicates
 
+        Args:
+            claim_ids: Only look for these claim IDs (the claims being loaded)
+                instead of reading every claim in the fact table
+
         Returns:
             Set of existing claim_id values in fact table
         """
         try:
-            self.cursor.execute("SELECT claim_id FROM fact_claims")
-            existing_claims = {row[0] for row in self.cursor.fetchall()}
+            if claim_ids is None:
+                self.cursor.execute("SELECT claim_id FROM fact_claims")
+                existing_claims = {row[0] for row in self._fetch_rows()}
+            elif not claim_ids:
+                existing_claims = set()
+            else:
+                # Stage the incoming IDs and let the server find those present
+                self.cursor.execute(CREATE_INCOMING_CLAIMS_SQL)
+                try:
+                    self.cursor.executemany(
+                        INSERT_INCOMING_CLAIM_SQL,
+                        [(claim_id,) for claim_id in claim_ids],
+                    )
+                    self.cursor.execute(EXISTING_INCOMING_CLAIMS_SQL)
+                    existing_claims = {row[0] for row in self._fetch_rows()}
+                finally:
+                    self.cursor.execute("DROP TABLE #incoming_claims")
+
             self.logger.info(
                 f"Found {len(existing_claims)} existing claims in fact table"
             )
@@ -419,6 +841,14 @@ class InsuranceFactLoader:
             self.logger.warning(f"Error getting existing claim IDs: {e}")
             return set()
 
+    def _fetch_rows(self) -> Iterator[Any]:
+        """Yield the current result set, fetched cursor.arraysize rows at a time"""
+        while True:
+            rows = self.cursor.fetchmany()
+            if not rows:
+                return
+            yield from rows
+
     def validate_fact_referential_integrity(
         self, surrogate_key_mappings: Dict[str, Dict[str, int]]
     ) -> bool:
@@ -434,43 +864,31 @@ class InsuranceFactLoader:
         self.logger.info("Validating fact table referential integrity")
 
         try:
-            validation_queries = [
-                # Check for orphaned customer references
-                """
-                SELECT COUNT(*) FROM fact_claims f
-                LEFT JOIN dim_customer c ON f.customer_key = c.customer_key
-                WHERE c.customer_key IS NULL
-                """,
-                # Check for orphaned policy references
-                """
-                SELECT COUNT(*) FROM fact_claims f
-                LEFT JOIN dim_policy p ON f.policy_key = p.policy_key
-                WHERE p.policy_key IS NULL
-                """,
-                # Check for orphaned agent references
-                """
-                SELECT COUNT(*) FROM fact_claims f
-                LEFT JOIN dim_agent a ON f.agent_key = a.agent_key
-                WHERE a.agent_key IS NULL
-                """,
-                # Check for orphaned filed date references
-                """
-                SELECT COUNT(*) FROM fact_claims f
-                LEFT JOIN dim_date d ON f.filed_date_key = d.date_key
-                WHERE d.date_key IS NULL
-                """,
-            ]
+            # Count the orphaned references of every dimension in one pass
+            # over fact_claims
+            validation_sql = """
+            SELECT
+                COUNT(CASE WHEN c.customer_key IS NULL THEN 1 END),
+                COUNT(CASE WHEN p.policy_key IS NULL THEN 1 END),
+                COUNT(CASE WHEN a.agent_key IS NULL THEN 1 END),
+                COUNT(CASE WHEN d.date_key IS NULL THEN 1 END)
+            FROM fact_claims f
+            LEFT JOIN dim_customer c ON f.customer_key = c.customer_key
+            LEFT JOIN dim_policy p ON f.policy_key = p.policy_key
+            LEFT JOIN dim_agent a ON f.agent_key = a.agent_key
+            LEFT JOIN dim_date d ON f.filed_date_key = d.date_key
+            """
 
             validation_names = ["customers", "policies", "agents", "filed_dates"]
             all_valid = True
 
-            for i, query in enumerate(validation_queries):
-                self.cursor.execute(query)
-                orphaned_count = self.cursor.fetchone()[0]
+            self.cursor.execute(validation_sql)
+            orphaned_counts = self.cursor.fetchone()
 
+            for name, orphaned_count in zip(validation_names, orphaned_counts):
                 if orphaned_count > 0:
                     self.logger.error(
-                        f"Found {orphaned_count} orphaned {validation_names[i]} references"
+                        f"Found {orphaned_count} orphaned {name} references"
                     )
                     all_valid = False
 
@@ -485,24 +903,91 @@ class InsuranceFactLoader:
             self.logger.error(f"Error validating referential integrity: {e}")
             return False
 
+    def _disable_fact_indexes(self) -> List[str]:
+        """
+        Disable the non-unique nonclustered indexes on fact_claims
+
+        The change is committed straight away so the loading connections are
+        not blocked by its schema lock.
+
+        Returns:
+            Names of the indexes that were disabled
+        """
+        self.cursor.execute(FACT_INDEXES_SQL)
+        indexes = [row.name for row in self.cursor.fetchall()]
+        for index in indexes:
+            self.cursor.execute(f"ALTER INDEX {index} ON fact_claims DISABLE")
+        self.connection.commit()
+
+        self.logger.info(f"Disabled {len(indexes)} fact_claims indexes for bulk load")
+        return indexes
+
+    def _rebuild_fact_indexes(self, indexes: List[str]):
+        """
+        Rebuild fact_claims indexes disabled for a bulk load
+
+        Runs on a fresh connection once the load has been committed or rolled
+        back, so the indexes come back whether or not the load succeeded.
+
+        Args:
+            indexes: Names of the disabled indexes
+        """
+        try:
+            self._connect_to_database()
+            for index in indexes:
+                self.cursor.execute(
+                    f"ALTER INDEX {index} ON fact_claims "
+                    "REBUILD WITH (ONLINE = OFF, SORT_IN_TEMPDB = ON)"
+                )
+            self.logger.info(f"Rebuilt {len(indexes)} fact_claims indexes")
+        except Exception as e:
+            self.logger.error(f"Failed to rebuild fact_claims indexes: {str(e)}")
+            raise
+        finally:
+            self._cleanup_connection()
+
     def _connect_to_database(self):
-        """Establish database connection"""
+        """Establish a database connection for the current thread"""
         try:
             connection_string = self.config.get_connection_string()
-            self.connection = pyodbc.connect(connection_string)
-            self.connection.autocommit = False  # Use transactions
-            self.cursor = self.connection.cursor()
+            connection = pyodbc.connect(
+                connection_string, attrs_before=self.config.get_connection_attributes()
+            )
+            connection.autocommit = False  # Use transactions
+            connection.timeout = self.config.db_query_timeout
+            cursor = connection.cursor()
+            cursor.fast_executemany = True  # Send executemany as one array
+            cursor.arraysize = FETCH_SIZE  # Rows per fetchmany() call
+            # Skip the "rows affected" message after every inserted claim
+            cursor.execute("SET NOCOUNT ON")
             self.logger.info(f"Connected to database: {self.config.db_name}")
         except Exception as e:
             raise ConnectionError(f"Failed to connect to database: {str(e)}")
 
-    def _cleanup_connection(self):
-        """Clean up database connection"""
-        if self.cursor:
-            self.cursor.close()
-        if self.connection:
-            self.connection.commit()  # Commit successful operations
-            self.connection.close()
+        self._local.connection = connection
+        self._local.cursor = cursor
+        with self._connections_lock:
+            self._connections.append((connection, cursor))
+
+    def _cleanup_connection(self, commit: bool = True):
+        """
+        Clean up every database connection opened by the loader
+
+        Args:
+            commit: Commit the work done on the connections, or roll it back
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+
+        for connection, cursor in connections:
+            cursor.close()
+            if commit:
+                connection.commit()  # Commit successful operations
+            else:
+                connection.rollback()
+            connection.close()
+
+        self._local = threading.local()
 
 
 def load_insurance_facts(
@@ -29,6 +29,8 @@ import sys
 from datetime import datetime
 from typing import Dict, List, Any
 
+import pandas as pd
+
 from config import load_config, InsuranceETLConfig
 from extract import extract_insurance_data
 from transform import transform_for_insurance_schema
@@ -138,7 +140,7 @@ class InsuranceETLPipeline:
         self.logger = logging.getLogger(__name__)
         self.logger.info("Insurance ETL Pipeline initialized successfully")
 
-    def _extract_data(self) -> Dict[str, List[Dict[str, Any]]]:
+    def _extract_data(self) -> Dict[str, pd.DataFrame]:
         """Extract data from all configured sources"""
         try:
             extracted_data = extract_insurance_data(self.config)
@@ -161,7 +163,7 @@ class InsuranceETLPipeline:
             raise
 
     def _transform_data(
-        self, raw_data: Dict[str, List[Dict[str, Any]]]
+        self, raw_data: Dict[str, pd.DataFrame]
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Transform raw data with business rules"""
         try:
@@ -20,11 +20,51 @@ Complexity Level: MEDIUM (~200 lines of code, 5 TODOs for students)
 
 import re
 import logging
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, date
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from typing import Callable, List, Dict, Any, Optional, Tuple, Union
+from datetime import date, datetime
 from collections import defaultdict
 from config import InsuranceETLConfig
 
+# Source data accepted by the prepare_* methods: an extracted DataFrame or a
+# list of record dictionaries
+SourceRecords = Union[pd.DataFrame, List[Dict[str, Any]]]
+
+# Claim columns that must be present on every fact record
+CLAIM_KEY_COLUMNS = ["claim_id", "policy_id", "customer_id", "agent_id"]
+
+# Translation table that deletes every ASCII character except the digits 0-9
+NON_DIGIT_TABLE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit())
+)
+
+# Random generator for demo agent attributes, created once per process
+_RNG = np.random.default_rng()
+
+
+@lru_cache(maxsize=65536)
+def _assign_agent_region(agent_id: str) -> str:
+    """
+    Assign agent region based on agent ID (cached per agent ID)
+
+    Args:
+        agent_id: Agent identifier
+
+    Returns:
+        str: Assigned region name
+    """
+    # Simple region assignment based on agent ID
+    agent_num = int(agent_id.replace("AGT", "")) if "AGT" in agent_id else 0
+
+    if agent_num <= 5:
+        return "North"
+    elif agent_num <= 10:
+        return "South"
+    else:
+        return "Central"
+
 
 class InsuranceTransformer:
     """
@@ -81,17 +121,18 @@ class InsuranceTransformer:
         # TODO: Your implementation here
         # Remove this pass statement and implement the method
         try:
-            dob = datetime.strptime(birth_date, "%Y-%m-%d")
-            now = date.today()
-            # Has birthday happened yet?
-            if now.month > dob.month:
-                return now.year - dob.year
-            elif now.month == dob.month and now.day >= dob.day:
-                return now.year - dob.year
+            # fromisoformat also takes forms such as "19850315" and week
+            # dates, so only the plain YYYY-MM-DD layout goes through it
+            if len(birth_date) == 10 and birth_date[4] == birth_date[7] == "-":
+                dob = date.fromisoformat(birth_date)
             else:
-                return max(now.year - dob.year - 1, 0) # catch case where less than 1 year
-        except ValueError:
+                dob = datetime.strptime(birth_date, "%Y-%m-%d").date()
+        except (TypeError, ValueError):
             return 0
+        today = date.today()
+        # Has birthday happened yet?
+        before_birthday = (today.month, today.day) < (dob.month, dob.day)
+        return max(today.year - dob.year - before_birthday, 0)
 
     def _classify_customer_risk(self, risk_score: float, age: int) -> str:
         """
@@ -151,7 +192,9 @@ class InsuranceTransformer:
         """
         # TODO: Your implementation here
         # Remove this pass statement and implement the method
-        phone = self.phone_pattern.sub("", phone) # Uses regex pattern to strip non-digit characters
+        phone = phone.translate(NON_DIGIT_TABLE) # Strips ASCII non-digit characters in one pass
+        if not phone.isascii():
+            phone = self.phone_pattern.sub("", phone) # Uses regex pattern for anything else
         if not phone: return "UNKNOWN"
         elif len(phone) == 10:
             return "(" + phone[:3] + ") " + phone[3:6] + "-" + phone[6:]
@@ -225,226 +268,264 @@ class InsuranceTransformer:
     # =====================================================================
 
     def prepare_customer_dimension(
-        self, customers: List[Dict[str, Any]]
+        self, customers: SourceRecords
     ) -> List[Dict[str, Any]]:
         """
         Transform and standardize customer data for dimension loading
-        This method is complete - it calls your TODO methods above.
+        This method is complete - it applies your TODO methods to every customer.
         """
         self.logger.info(
             f"Transforming customer dimension with {len(customers)} records"
         )
 
-        transformed_customers = []
-
-        for customer in customers:
-            try:
-                # Calculate age from birth_date (calls your TODO #1)
-                age = self._calculate_customer_age(customer.get("birth_date", ""))
-
-                # Clean and standardize names
-                first_name, last_name, full_name = self._clean_customer_name(
-                    customer.get("first_name", ""), customer.get("last_name", "")
-                )
-
-                # Standardize phone number (calls your TODO #3)
-                phone = self._standardize_phone(customer.get("phone", ""))
-
-                # Classify risk tier (calls your TODO #2)
-                risk_score = float(customer.get("risk_score", 0))
-                risk_tier = self._classify_customer_risk(risk_score, age)
-
-                # Create transformed customer record
-                transformed_customer = {
-                    "customer_id": customer["customer_id"],
-                    "first_name": first_name,
-                    "last_name": last_name,
-                    "full_name": full_name,
-                    "email": customer.get("email", "").lower(),
-                    "phone": phone,
-                    "birth_date": customer.get("birth_date", ""),
-                    "age": age,
-                    "address": customer.get("address", ""),
-                    "city": customer.get("city", ""),
-                    "state": customer.get("state", ""),
-                    "risk_score": risk_score,
-                    "risk_tier": risk_tier,
-                    "customer_since": customer.get("customer_since", ""),
-                }
-
-                transformed_customers.append(transformed_customer)
-
-            except Exception as e:
-                self.logger.warning(
-                    f"Error transforming customer {customer.get('customer_id')}: {e}"
-                )
-                continue
+        df = pd.DataFrame(customers)
+        if df.empty:
+            self.logger.info("Transformed 0 customer records")
+            return []
+
+        # Calculate ages from birth_date (TODO #1)
+        birth_date = self._column(df, "birth_date", "")
+        age = self._map_unique(birth_date, self._calculate_customer_age)
+
+        # Clean and standardize names
+        first_name, last_name, full_name = self._clean_customer_names(
+            self._column(df, "first_name", ""), self._column(df, "last_name", "")
+        )
+
+        # Standardize phone numbers (TODO #3)
+        phone = self._map_unique(self._column(df, "phone", ""), self._standardize_phone)
+
+        # Classify risk tiers (TODO #2)
+        risk_score, risk_error = self._numeric_column(df, "risk_score")
+        risk_tier = [
+            self._classify_customer_risk(score, customer_age)
+            for score, customer_age in zip(risk_score, age)
+        ]
+
+        email = self._column(df, "email", "").str.lower()
+        error = (
+            self._column(df, "customer_id").isna()
+            | first_name.isna()
+            | last_name.isna()
+            | email.isna()
+            | risk_error
+        )
+        for customer_id in self._column(df, "customer_id")[error]:
+            self.logger.warning(
+                f"Error transforming customer {customer_id}: invalid or missing value"
+            )
+
+        transformed = pd.DataFrame(
+            {
+                "customer_id": self._column(df, "customer_id"),
+                "first_name": first_name,
+                "last_name": last_name,
+                "full_name": full_name,
+                "email": email,
+                "phone": phone,
+                "birth_date": birth_date,
+                "age": age,
+                "address": self._column(df, "address", ""),
+                "city": self._column(df, "city", ""),
+                "state": self._column(df, "state", ""),
+                "risk_score": risk_score,
+                "risk_tier": risk_tier,
+                "customer_since": self._column(df, "customer_since", ""),
+            }
+        )[~error]
+        transformed_customers = transformed.to_dict(orient="records")
 
         self.logger.info(f"Transformed {len(transformed_customers)} customer records")
         return transformed_customers
 
     def prepare_policy_dimension(
-        self, policies: List[Dict[str, Any]]
+        self, policies: SourceRecords
     ) -> List[Dict[str, Any]]:
         """
         Transform and enrich policy data for dimension loading
-        This method is complete - it calls your TODO methods above.
+        This method is complete - it applies your TODO #4 method to every policy.
         """
         self.logger.info(f"Transforming policy dimension with {len(policies)} records")
 
-        transformed_policies = []
-
-        for policy in policies:
-            try:
-                # Determine premium tier (calls your TODO #4)
-                annual_premium = float(policy.get("annual_premium", 0))
-                premium_tier = self._determine_premium_tier(annual_premium)
-
-                # Validate and clean policy data
-                coverage_amount = float(policy.get("coverage_amount", 0))
-                deductible = float(policy.get("deductible", 0))
-
-                # Create transformed policy record
-                transformed_policy = {
-                    "policy_id": policy["policy_id"],
-                    "customer_id": policy["customer_id"],
-                    "policy_type": policy.get("policy_type", "").title(),
-                    "coverage_amount": coverage_amount,
-                    "annual_premium": annual_premium,
-                    "premium_tier": premium_tier,
-                    "deductible": deductible,
-                    "effective_date": policy.get("effective_date", ""),
-                    "expiration_date": policy.get("expiration_date", ""),
-                    "status": policy.get("status", "Active"),
-                }
-
-                transformed_policies.append(transformed_policy)
-
-            except Exception as e:
-                self.logger.warning(
-                    f"Error transforming policy {policy.get('policy_id')}: {e}"
-                )
-                continue
+        df = pd.DataFrame(policies)
+        if df.empty:
+            self.logger.info("Transformed 0 policy records")
+            return []
+
+        annual_premium, premium_error = self._numeric_column(df, "annual_premium")
+        coverage_amount, coverage_error = self._numeric_column(df, "coverage_amount")
+        deductible, deductible_error = self._numeric_column(df, "deductible")
+        policy_type = self._column(df, "policy_type", "").str.title()
+
+        # Determine premium tier (TODO #4), once per distinct premium
+        premium_tier = self._map_unique(annual_premium, self._determine_premium_tier)
+
+        error = (
+            self._column(df, "policy_id").isna()
+            | self._column(df, "customer_id").isna()
+            | policy_type.isna()
+            | premium_error
+            | coverage_error
+            | deductible_error
+        )
+        for policy_id in self._column(df, "policy_id")[error]:
+            self.logger.warning(
+                f"Error transforming policy {policy_id}: invalid or missing value"
+            )
+
+        transformed = pd.DataFrame(
+            {
+                "policy_id": self._column(df, "policy_id"),
+                "customer_id": self._column(df, "customer_id"),
+                "policy_type": policy_type,
+                "coverage_amount": coverage_amount,
+                "annual_premium": annual_premium,
+                "premium_tier": premium_tier,
+                "deductible": deductible,
+                "effective_date": self._column(df, "effective_date", ""),
+                "expiration_date": self._column(df, "expiration_date", ""),
+                "status": self._column(df, "status", "Active"),
+            }
+        )[~error]
+        transformed_policies = transformed.to_dict(orient="records")
 
         self.logger.info(f"Transformed {len(transformed_policies)} policy records")
         return transformed_policies
     
     def prepare_agent_dimension(
-        self, claims: List[Dict[str, Any]]
+        self, claims: SourceRecords
     ) -> List[Dict[str, Any]]:
         """
         Extract and prepare agent dimension data from claims
         Args:
-            claims: List of claims records containing agent info
+            claims: Claims DataFrame or records containing agent info
         Returns:
             List of unique agent dimension records
         """
         self.logger.info("Extracting agent dimension from claims data")
-        # Extract unique agents from claims
-        agents_dict = {}
-        for claim in claims:
-            agent_id = claim.get("agent_id")
-            if agent_id and agent_id not in agents_dict:
-                # Create basic agent record
-                # Parse agent name from ID if format allows
-                agent_parts = agent_id.replace("AGT", "Agent ").split()
-                agent = {
-                    "agent_id": agent_id,
-                    "first_name": agent_parts[0] if agent_parts else "Agent",
-                    "last_name": agent_parts[1] if len(agent_parts) > 1 else agent_id,
-                    "full_name": f"Agent {agent_id}",
-                    "region": self._assign_agent_region(agent_id),
-                    "experience_years": self._estimate_experience_years(),
-                    "hire_date": None,  # Could be populated from HR system
-                }
-                agents_dict[agent_id] = agent
-        agents = list(agents_dict.values())
+        # Extract unique agent IDs first (in first-seen order), then build records
+        agent_ids = self._column(pd.DataFrame(claims), "agent_id", "")
+        unique_ids = agent_ids[agent_ids.astype(bool)].unique()
+        experience_years = self._estimate_experience_years(len(unique_ids))
+        agents = [
+            self._build_agent_record(agent_id, years)
+            for agent_id, years in zip(unique_ids, experience_years)
+        ]
         self.logger.info(f"Extracted {len(agents)} unique agents from claims")
         return agents
     
-    def prepare_date_dimension_keys(self, claims: List[Dict[str, Any]]) -> List[int]:
+    def prepare_date_dimension_keys(self, claims: SourceRecords) -> List[int]:
         """
         Extract and format date keys from claims data
         Args:
-            claims: List of claims records
+            claims: Claims DataFrame or records
         Returns:
             List of unique date keys in YYYYMMDD format
         """
-        date_keys = set()
-        for claim in claims:
-            # Process filed_date
-            filed_date = claim.get("filed_date")
-            if filed_date:
-                date_key = self._generate_date_key(filed_date)
-                if date_key > 0:
-                    date_keys.add(date_key)
-            # Process closed_date if available
-            closed_date = claim.get("closed_date")
-            if closed_date:
-                date_key = self._generate_date_key(closed_date)
-                if date_key > 0:
-                    date_keys.add(date_key)
+        # Process filed_date and closed_date (when available) of every claim
+        df = pd.DataFrame(claims)
+        date_keys = set(
+            pd.concat(
+                [
+                    self._generate_date_keys(self._column(df, "filed_date")),
+                    self._generate_date_keys(self._column(df, "closed_date")),
+                ]
+            ).tolist()
+        ) - {0}
         sorted_keys = sorted(list(date_keys))
         self.logger.info(f"Generated {len(sorted_keys)} unique date keys")
         return sorted_keys
 
     def prepare_claims_facts(
-        self, claims: List[Dict[str, Any]]
+        self, claims: SourceRecords
     ) -> List[Dict[str, Any]]:
         """
         Transform claims data for fact table loading
-        This method is complete - it calls your TODO methods above.
+        This method is complete - it applies your TODO #5 method to every claim.
         """
         self.logger.info(f"Transforming claims facts with {len(claims)} records")
 
-        transformed_facts = []
-
-        for claim in claims:
-            try:
-                # Validate claim amount against coverage (calls your TODO #5)
-                claim_amount = float(claim.get("claim_amount", 0))
-                coverage_amount = float(claim.get("coverage_amount", 0))
-
-                if not self._validate_claim_amount(claim_amount, coverage_amount):
-                    self.logger.warning(
-                        f"Invalid claim amount for {claim.get('claim_id')}"
-                    )
-                    continue
-
-                # Generate date keys
-                filed_date_key = self._generate_date_key(claim.get("filed_date"))
-                closed_date_key = (
-                    self._generate_date_key(claim.get("closed_date"))
-                    if claim.get("closed_date")
-                    else None
-                )
-
-                # Calculate processing days
-                processing_days = int(claim.get("processing_days", 0))
-
-                # Create fact record
-                fact_record = {
-                    "claim_id": claim["claim_id"],
-                    "policy_id": claim["policy_id"],
-                    "customer_id": claim["customer_id"],
-                    "agent_id": claim["agent_id"],
-                    "filed_date_key": filed_date_key,
-                    "closed_date_key": closed_date_key,
-                    "claim_amount": claim_amount,
-                    "coverage_amount": coverage_amount,
-                    "deductible_amount": float(claim.get("deductible_amount", 0)),
-                    "payout_amount": float(claim.get("payout_amount", 0)),
-                    "processing_days": processing_days,
-                    "claim_status": claim.get("claim_status", ""),
-                }
-
-                transformed_facts.append(fact_record)
-
-            except Exception as e:
-                self.logger.warning(
-                    f"Error transforming claim {claim.get('claim_id')}: {e}"
-                )
-                continue
+        df = pd.DataFrame(claims)
+        if df.empty:
+            self.logger.info("Transformed 0 claims fact records")
+            return []
+
+        claim_ids = self._column(df, "claim_id")
+        claim_amount, claim_amount_error = self._numeric_column(df, "claim_amount")
+        coverage_amount, coverage_error = self._numeric_column(df, "coverage_amount")
+        deductible_amount, deductible_error = self._numeric_column(
+            df, "deductible_amount"
+        )
+        payout_amount, payout_error = self._numeric_column(df, "payout_amount")
+        processing_days, processing_error = self._numeric_column(
+            df, "processing_days"
+        )
+
+        # processing_days must be a whole number that fits in int64 (this
+        # rules out missing and infinite values too)
+        whole_days = (
+            np.isfinite(processing_days)
+            & (processing_days == np.floor(processing_days))
+            & (processing_days.abs() < 2**63)
+        )
+
+        # Validate claim amounts against coverage (TODO #5)
+        amount_error = claim_amount_error | coverage_error
+        valid_amount = pd.Series(
+            [
+                self._validate_claim_amount(claim, coverage)
+                for claim, coverage in zip(claim_amount, coverage_amount)
+            ],
+            index=df.index,
+            dtype=bool,
+        )
+        invalid = ~amount_error & ~valid_amount
+        for claim_id in claim_ids[invalid]:
+            self.logger.warning(f"Invalid claim amount for {claim_id}")
+
+        error = ~invalid & (
+            amount_error
+            | deductible_error
+            | payout_error
+            | processing_error
+            | ~whole_days
+            | df.reindex(columns=CLAIM_KEY_COLUMNS).isna().any(axis=1)
+        )
+        for claim_id in claim_ids[error]:
+            self.logger.warning(
+                f"Error transforming claim {claim_id}: invalid or missing value"
+            )
+
+        # Generate date keys
+        closed_date = self._column(df, "closed_date")
+        closed_date_key = (
+            self._generate_date_keys(closed_date)
+            .astype(object)
+            .where(closed_date.notna() & closed_date.ne(""), None)
+        )
+
+        transformed = pd.DataFrame(
+            {
+                "claim_id": claim_ids,
+                "policy_id": self._column(df, "policy_id"),
+                "customer_id": self._column(df, "customer_id"),
+                "agent_id": self._column(df, "agent_id"),
+                "filed_date_key": self._generate_date_keys(
+                    self._column(df, "filed_date")
+                ),
+                "closed_date_key": closed_date_key,
+                "claim_amount": claim_amount,
+                "coverage_amount": coverage_amount,
+                "deductible_amount": deductible_amount,
+                "payout_amount": payout_amount,
+                "processing_days": processing_days,
+                "claim_status": self._column(df, "claim_status", ""),
+            }
+        )[~(invalid | error)]
+        transformed["processing_days"] = transformed["processing_days"].astype(
+            "int64"
+        )
+        transformed_facts = transformed.to_dict(orient="records")
 
         self.logger.info(f"Transformed {len(transformed_facts)} claims fact records")
         return transformed_facts
@@ -453,104 +534,133 @@ class InsuranceTransformer:
     # HELPER METHODS - ALREADY IMPLEMENTED
     # =====================================================================
 
-    def _clean_customer_name(self, first_name: str, last_name: str) -> Tuple[str, str, str]:
+    def _clean_customer_names(
+        self, first_names: pd.Series, last_names: pd.Series
+    ) -> Tuple[pd.Series, pd.Series, pd.Series]:
         """
         Clean and standardize customer names
 
         Args:
-            first_name: Raw first name
-            last_name: Raw last name
+            first_names: Raw first names
+            last_names: Raw last names
 
         Returns:
-            Tuple of (cleaned_first_name, cleaned_last_name, full_name)
+            Tuple of (cleaned_first_names, cleaned_last_names, full_names)
         """
-        # Clean and apply basic title case
-        first_clean = first_name.strip().title() if first_name else ""
-        last_clean = last_name.strip().title() if last_name else ""
-
-        # Handle special name cases (apostrophes, hyphens, etc.)
-        first_clean = self._fix_name_casing(first_clean)
-        last_clean = self._fix_name_casing(last_clean)
+        # Clean and apply title case; title() starts a new word after any
+        # non-letter, so apostrophe and hyphen names (O'Brien, Mary-Jane)
+        # come out right in the same pass
+        first_clean = first_names.str.strip().str.title()
+        last_clean = last_names.str.strip().str.title()
 
         # Create full name
-        full_name = f"{first_clean} {last_clean}".strip()
+        full_name = (first_clean + " " + last_clean).str.strip()
 
         return first_clean, last_clean, full_name
 
 
-    def _fix_name_casing(self, name: str) -> str:
-        """Fix common name casing issues"""
-        if not name:
-            return name
+    def _build_agent_record(
+        self, agent_id: str, experience_years: int
+    ) -> Dict[str, Any]:
+        """
+        Build an agent dimension record from an agent ID
+
+        Args:
+            agent_id: Agent identifier
+            experience_years: Estimated years of experience
 
-        # Handle names with apostrophes (O'Brien, D'Angelo)
-        if "'" in name:
-            parts = name.split("'")
-            name = "'".join([part.capitalize() for part in parts])
+        Returns:
+            Agent dimension record
+        """
+        # Parse agent name from ID if format allows
+        agent_parts = agent_id.replace("AGT", "Agent ").split()
+        return {
+            "agent_id": agent_id,
+            "first_name": agent_parts[0] if agent_parts else "Agent",
+            "last_name": agent_parts[1] if len(agent_parts) > 1 else agent_id,
+            "full_name": f"Agent {agent_id}",
+            "region": _assign_agent_region(agent_id),
+            "experience_years": experience_years,
+            "hire_date": None,  # Could be populated from HR system
+        }
 
-        # Handle names with hyphens (Mary-Jane, Jean-Luc)
-        if "-" in name:
-            parts = name.split("-")
-            name = "-".join([part.capitalize() for part in parts])
 
-        return name
+    def _estimate_experience_years(self, count: int) -> List[int]:
+        """Estimate experience years for count agents at once (random for demo)"""
+        return _RNG.integers(1, 16, size=count).tolist()
 
 
-    def _assign_agent_region(self, agent_id: str) -> str:
+    def _generate_date_keys(self, date_values: pd.Series) -> pd.Series:
         """
-        Assign agent region based on agent ID
+        Generate date keys in YYYYMMDD format for a whole column of dates
 
         Args:
-            agent_id: Agent identifier
+            date_values: Series of date values (strings or datetimes)
 
         Returns:
-            str: Assigned region name
+            pd.Series: Integer date keys, 0 where the date is missing or invalid
         """
-        # Simple region assignment based on agent ID
-        agent_num = int(agent_id.replace("AGT", "")) if "AGT" in agent_id else 0
+        dates = pd.to_datetime(date_values, format="%Y-%m-%d", errors="coerce")
+        date_keys = dates.dt.year * 10000 + dates.dt.month * 100 + dates.dt.day
+        return date_keys.fillna(0).astype("int64")
 
-        if agent_num <= 5:
-            return "North"
-        elif agent_num <= 10:
-            return "South"
-        else:
-            return "Central"
 
+    def _column(self, df: pd.DataFrame, column: str, default: Any = None) -> pd.Series:
+        """
+        Get a column from a DataFrame, falling back to a constant default
 
-    def _estimate_experience_years(self) -> int:
-        """Estimate agent experience years (random for demo)"""
-        import random
+        Args:
+            df: Source DataFrame
+            column: Column name
+            default: Value used where the column or a row's value is missing
 
-        return random.randint(1, 15)
+        Returns:
+            pd.Series: Column values aligned to the DataFrame index
+        """
+        if column not in df:
+            return pd.Series(default, index=df.index, dtype=object)
+        if default is None:
+            return df[column]
+        return df[column].fillna(default)
 
 
-    def _generate_date_key(self, date_value: Any) -> int:
+    def _numeric_column(
+        self, df: pd.DataFrame, column: str
+    ) -> Tuple[pd.Series, pd.Series]:
         """
-        Generate date key in YYYYMMDD format
+        Convert a column to numbers, flagging values that cannot be parsed
 
         Args:
-            date_value: Date value (string or datetime)
+            df: Source DataFrame
+            column: Column name (treated as 0 when absent)
 
         Returns:
-            int: Date key in YYYYMMDD format
+            Tuple of (float values, mask of unparseable values)
         """
-        if not date_value:
-            return 0
+        values = self._column(df, column, 0)
+        numbers = pd.to_numeric(values, errors="coerce").astype("float64")
+        return numbers, numbers.isna() & values.notna()
 
-        try:
-            if isinstance(date_value, str):
-                dt = datetime.strptime(date_value, "%Y-%m-%d")
-                return int(dt.strftime("%Y%m%d"))
-            elif isinstance(date_value, (datetime, date)):
-                return int(date_value.strftime("%Y%m%d"))
-            else:
-                return 0
-        except (ValueError, AttributeError):
-            return 0
+
+    def _map_unique(self, values: pd.Series, rule: Callable[[Any], Any]) -> pd.Series:
+        """
+        Apply a single-value business rule to a column
+
+        The rule runs once per distinct value, so repeated values cost a lookup.
+
+        Args:
+            values: Column values
+            rule: Business rule taking one value
+
+        Returns:
+            pd.Series: The rule's result for every value
+        """
+        unique = values.unique()
+        return values.map(dict(zip(unique, map(rule, unique))))
 
 
     def transform_all_for_insurance_schema(
-        self, raw_data: Dict[str, List[Dict[str, Any]]]
+        self, raw_data: Dict[str, pd.DataFrame]
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Transform all data sources for insurance star schema loading
@@ -562,21 +672,26 @@ class InsuranceTransformer:
             Dictionary containing transformed data ready for dimension and fact loading
         """
         self.logger.info("Starting coordinated transformation for insurance schema")
-        transformed_data = {}
-
-        # Transform customer dimension data
+        # The extracted DataFrames are transformed directly, without an
+        # intermediate list of record dictionaries per source
         customers = raw_data.get("customers", [])
-        transformed_data["dim_customer"] = self.prepare_customer_dimension(customers)
-
-        # Transform policy dimension data
         policies = raw_data.get("policies", [])
-        transformed_data["dim_policy"] = self.prepare_policy_dimension(policies)
-
-        # Transform claims data for facts and agent dimension
         claims = raw_data.get("claims", [])
-        transformed_data["dim_agent"] = self.prepare_agent_dimension(claims)
-        transformed_data["fact_claims"] = self.prepare_claims_facts(claims)
-        transformed_data["date_keys"] = self.prepare_date_dimension_keys(claims)
+
+        # The components are transformed one after another: their work is
+        # mostly string handling and per-value business rules, which hold the
+        # GIL, so running them on threads does not speed them up
+        transforms = {
+            "dim_customer": (self.prepare_customer_dimension, customers),
+            "dim_policy": (self.prepare_policy_dimension, policies),
+            "dim_agent": (self.prepare_agent_dimension, claims),
+            "fact_claims": (self.prepare_claims_facts, claims),
+            "date_keys": (self.prepare_date_dimension_keys, claims),
+        }
+        transformed_data = {
+            component: transform(data)
+            for component, (transform, data) in transforms.items()
+        }
 
         # Log transformation summary
         self.logger.info("Transformation Summary:")
@@ -590,7 +705,7 @@ class InsuranceTransformer:
 
 
 def transform_for_insurance_schema(
-    config: InsuranceETLConfig, raw_data: Dict[str, List[Dict[str, Any]]]
+    config: InsuranceETLConfig, raw_data: Dict[str, pd.DataFrame]
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
     Convenience function to transform all data for insurance schema
@@ -2,25 +2,25 @@
 Book Catalog CSV Data Generator for BookHaven ETL Assessment
 """
 import pandas as pd
+import numpy as np
 from faker import Faker
-import random
 
 def generate_book_catalog(num_records=1000, output_path='data/csv/book_catalog.csv'):
     """Generate a book catalog CSV with data quality issues."""
     fake = Faker()
-    data = []
+    rng = np.random.default_rng()
+    n = num_records
     genres = ['Fiction', 'Non-Fiction', 'Sci-Fi', 'Fantasy', 'Mystery', 'Romance']
-    for i in range(num_records):
-        # Intentionally introduce data quality issues
-        title = fake.sentence(nb_words=4) if random.random() > 0.05 else ''  # 5% missing
-        author = fake.name() if random.random() > 0.02 else None  # 2% missing
-        genre = random.choice(genres) if random.random() > 0.03 else 'Unknown'  # 3% invalid
-        pub_date = fake.date() if random.random() > 0.1 else '32-13-2020'  # 10% invalid
-        isbn = fake.isbn13() if random.random() > 0.05 else 'INVALID'  # 5% invalid
-        series = fake.word() if random.random() > 0.8 else ''  # 20% missing
-        recommended = random.choice(['Yes', 'No', ''])  # Some missing
-        data.append([title, author, genre, pub_date, isbn, series, recommended])
-    df = pd.DataFrame(data, columns=['title', 'author', 'genre', 'pub_date', 'isbn', 'series', 'recommended'])
+    # Intentionally introduce data quality issues, one column at a time
+    df = pd.DataFrame({
+        'title': np.where(rng.random(n) > 0.05, [fake.sentence(nb_words=4) for _ in range(n)], ''),  # 5% missing
+        'author': np.where(rng.random(n) > 0.02, [fake.name() for _ in range(n)], None),  # 2% missing
+        'genre': np.where(rng.random(n) > 0.03, rng.choice(genres, n), 'Unknown'),  # 3% invalid
+        'pub_date': np.where(rng.random(n) > 0.1, [fake.date() for _ in range(n)], '32-13-2020'),  # 10% invalid
+        'isbn': np.where(rng.random(n) > 0.05, [fake.isbn13() for _ in range(n)], 'INVALID'),  # 5% invalid
+        'series': np.where(rng.random(n) > 0.8, [fake.word() for _ in range(n)], ''),  # 20% missing
+        'recommended': rng.choice(['Yes', 'No', ''], n),  # Some missing
+    })
     # Add duplicates
     df = pd.concat([df, df.sample(frac=0.05, random_state=42)], ignore_index=True)
     df.to_csv(output_path, index=False)
@@ -1,7 +1,7 @@
 import pandas as pd
 import sqlalchemy
 import os
-from config import DATABASE_CONFIG
+from config import DATABASE_CONFIG, BATCH_SIZE
 
 CSV_TABLES = [
     ("orders", os.path.join("data", "sqlserver", "orders.csv")),
@@ -16,13 +16,14 @@ SQL_CONN_STR = (
 )
 
 def main():
-    engine = sqlalchemy.create_engine(SQL_CONN_STR)
+    # fast_executemany sends each chunk of rows to SQL Server as one parameter array
+    engine = sqlalchemy.create_engine(SQL_CONN_STR, fast_executemany=True)
     for table, csv_path in CSV_TABLES:
         if not os.path.exists(csv_path):
             print(f"CSV not found: {csv_path}")
             continue
         df = pd.read_csv(csv_path)
-        df.to_sql(table, engine, if_exists='replace', index=False)
+        df.to_sql(table, engine, if_exists='replace', index=False, chunksize=BATCH_SIZE)
         print(f"Loaded {len(df)} rows into table '{table}'")
 
 if __name__ == "__main__":
@@ -1,25 +1,41 @@
 import json
 import pymongo
 import os
+from itertools import islice
+
+try:
+    import ijson  # Optional: stream the records instead of loading the whole file
+except ImportError:
+    ijson = None
 
 MONGO_URI = "mongodb://localhost:27017"
 DB_NAME = "bookhaven_customers"
 COLLECTION_NAME = "customers"
 JSON_PATH = os.path.join("data", "mongodb", "customers.json")
+BATCH_SIZE = 1000  # Records per insert_many call
 
 client = pymongo.MongoClient(MONGO_URI)
 db = client[DB_NAME]
 collection = db[COLLECTION_NAME]
 
-with open(JSON_PATH, "r") as f:
-    data = json.load(f)
+with open(JSON_PATH, "rb") as f:
+    if ijson is not None:
+        if next(ijson.parse(f))[1] != "start_array":
+            raise ValueError("Expected a list of customer records in JSON file.")
+        f.seek(0)
+        records = ijson.items(f, "item", use_float=True)  # Yields one record at a time
+    else:
+        data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError("Expected a list of customer records in JSON file.")
+        records = iter(data)
 
-if not isinstance(data, list):
-    raise ValueError("Expected a list of customer records in JSON file.")
+    collection.delete_many({})  # Clear existing data for idempotency
+    inserted = 0
+    while batch := list(islice(records, BATCH_SIZE)):
+        inserted += len(collection.insert_many(batch).inserted_ids)
 
-collection.delete_many({})  # Clear existing data for idempotency
-if data:
-    result = collection.insert_many(data)
-    print(f"Inserted {len(result.inserted_ids)} customer records into MongoDB.")
+if inserted:
+    print(f"Inserted {inserted} customer records into MongoDB.")
 else:
-    print("No customer records to insert.") 
\ No newline at end of file
+    print("No customer records to insert.")
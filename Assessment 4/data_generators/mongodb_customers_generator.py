@@ -6,6 +6,11 @@ from faker import Faker
 import random
 import json
 
+try:
+    import orjson  # Optional: faster JSON serialization
+except ImportError:
+    orjson = None
+
 def generate_customers(num_records=500, output_path='data/mongodb/customers.json'):
     """Generate customer profiles with reading history and genre preferences, with data quality issues."""
     fake = Faker()
@@ -28,8 +33,12 @@ def generate_customers(num_records=500, output_path='data/mongodb/customers.json
         })
     # Add duplicates
     data += random.sample(data, k=int(0.05 * num_records))
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))  # Same 2-space layout, written once
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(data, f, indent=2)
 
 def main():
     generate_customers()
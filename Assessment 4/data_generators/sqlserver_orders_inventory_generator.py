@@ -2,23 +2,23 @@
 SQL Server Orders & Inventory Data Generator for BookHaven ETL Assessment
 """
 import pandas as pd
+import numpy as np
 from faker import Faker
-import random
 import os
 
 def generate_orders(num_records=800, output_path='data/sqlserver/orders.csv'):
     """Generate orders data with data quality issues."""
     fake = Faker()
-    data = []
-    for i in range(num_records):
-        order_id = i + 1
-        customer_id = random.randint(1, 500)
-        book_isbn = fake.isbn13() if random.random() > 0.03 else 'INVALID'  # 3% invalid
-        order_date = fake.date() if random.random() > 0.1 else '2020-02-30'  # 10% invalid
-        quantity = random.randint(1, 5) if random.random() > 0.05 else -1  # 5% invalid
-        price = round(random.uniform(5, 100), 2) if random.random() > 0.05 else None  # 5% missing
-        data.append([order_id, customer_id, book_isbn, order_date, quantity, price])
-    df = pd.DataFrame(data, columns=['order_id', 'customer_id', 'book_isbn', 'order_date', 'quantity', 'price'])
+    rng = np.random.default_rng()
+    n = num_records
+    df = pd.DataFrame({
+        'order_id': np.arange(1, n + 1),
+        'customer_id': rng.integers(1, 501, n),
+        'book_isbn': np.where(rng.random(n) > 0.03, [fake.isbn13() for _ in range(n)], 'INVALID'),  # 3% invalid
+        'order_date': np.where(rng.random(n) > 0.1, [fake.date() for _ in range(n)], '2020-02-30'),  # 10% invalid
+        'quantity': np.where(rng.random(n) > 0.05, rng.integers(1, 6, n), -1),  # 5% invalid
+        'price': np.where(rng.random(n) > 0.05, rng.uniform(5, 100, n).round(2), np.nan),  # 5% missing
+    })
     # Add duplicates
     df = pd.concat([df, df.sample(frac=0.05, random_state=42)], ignore_index=True)
     df.to_csv(output_path, index=False)
@@ -26,13 +26,13 @@ def generate_orders(num_records=800, output_path='data/sqlserver/orders.csv'):
 def generate_inventory(num_records=300, output_path='data/sqlserver/inventory.csv'):
     """Generate inventory data with data quality issues."""
     fake = Faker()
-    data = []
-    for i in range(num_records):
-        isbn = fake.isbn13() if random.random() > 0.03 else 'INVALID'  # 3% invalid
-        stock = random.randint(0, 100) if random.random() > 0.05 else -1  # 5% invalid
-        location = fake.city() if random.random() > 0.02 else ''  # 2% missing
-        data.append([isbn, stock, location])
-    df = pd.DataFrame(data, columns=['isbn', 'stock', 'location'])
+    rng = np.random.default_rng()
+    n = num_records
+    df = pd.DataFrame({
+        'isbn': np.where(rng.random(n) > 0.03, [fake.isbn13() for _ in range(n)], 'INVALID'),  # 3% invalid
+        'stock': np.where(rng.random(n) > 0.05, rng.integers(0, 101, n), -1),  # 5% invalid
+        'location': np.where(rng.random(n) > 0.02, [fake.city() for _ in range(n)], ''),  # 2% missing
+    })
     # Add duplicates
     df = pd.concat([df, df.sample(frac=0.05, random_state=42)], ignore_index=True)
     df.to_csv(output_path, index=False)
@@ -40,14 +40,14 @@ def generate_inventory(num_records=300, output_path='data/sqlserver/inventory.cs
 def generate_customers(num_records=500, output_path='data/sqlserver/customers.csv'):
     """Generate customer master data with data quality issues."""
     fake = Faker()
-    data = []
-    for i in range(num_records):
-        customer_id = i + 1
-        name = fake.name() if random.random() > 0.02 else None  # 2% missing
-        email = fake.email() if random.random() > 0.05 else 'bad-email'  # 5% invalid
-        phone = fake.phone_number() if random.random() > 0.1 else ''  # 10% missing
-        data.append([customer_id, name, email, phone])
-    df = pd.DataFrame(data, columns=['customer_id', 'name', 'email', 'phone'])
+    rng = np.random.default_rng()
+    n = num_records
+    df = pd.DataFrame({
+        'customer_id': np.arange(1, n + 1),
+        'name': np.where(rng.random(n) > 0.02, [fake.name() for _ in range(n)], None),  # 2% missing
+        'email': np.where(rng.random(n) > 0.05, [fake.email() for _ in range(n)], 'bad-email'),  # 5% invalid
+        'phone': np.where(rng.random(n) > 0.1, [fake.phone_number() for _ in range(n)], ''),  # 10% missing
+    })
     # Add duplicates
     df = pd.concat([df, df.sample(frac=0.05, random_state=42)], ignore_index=True)
     df.to_csv(output_path, index=False)
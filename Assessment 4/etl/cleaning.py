@@ -15,6 +15,17 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once per process and shared by every call
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+NON_DIGIT_PATTERN = re.compile(r"[^\d]")
+TEXT_SPECIAL_CHARS_PATTERN = re.compile(r"[^\w\s.,!]")
+
+# Missing value strategies for handle_missing_values: (df, fill_value) -> cleaned df
+MISSING_VALUE_STRATEGIES = {
+    'drop': lambda df, fill_value: df.dropna(),
+    'fill': lambda df, fill_value: df.fillna(fill_value),
+}
+
 # --- Clean Dates ---
 def clean_dates(df: pd.DataFrame, field: str) -> pd.DataFrame:
     """Clean and standardize date fields to YYYY-MM-DD format.
@@ -35,13 +46,10 @@ def clean_emails(df: pd.DataFrame, field: str) -> pd.DataFrame:
     """Clean and validate email fields (set invalid emails to None or NaN). (NaN fails tests, use None.)
     Hint: Use regular expressions and pandas apply. See 'Data Quality & Cleaning with Pandas' and 'Unit Testing for Data Transformations'.
     """
-    email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-    
     try:
-        df[field] = df[field].apply(
-            func=lambda x: x if x and email_pattern.match(x) else None # If x is empty or does not match pattern, set to NaN
-        )
-    except TypeError as e:
+        emails = df[field].astype(object) # Object dtype keeps None (string dtype would turn it into NaN)
+        df[field] = emails.where(emails.str.match(EMAIL_PATTERN, na=False), None) # If x is empty or does not match pattern, set to None
+    except (TypeError, AttributeError) as e: # AttributeError: .str on a non-string column
         logger.error(f"Unable to parse all values in column {field}: {e}")
 
     return df 
@@ -51,13 +59,11 @@ def clean_phone_numbers(df: pd.DataFrame, field: str) -> pd.DataFrame:
     """Standardize phone numbers (remove non-digits, set invalid to None).
     Hint: Use regular expressions and pandas string methods. See 'Data Quality & Cleaning with Pandas'.
     """
-    phone_pattern = re.compile(r"[^\d]")
     try:
         if field in df.columns:
-            df[field] = df[field].str.strip().str.replace(phone_pattern, "", regex=True).apply( # Strip whitespace, then remove all non-numeric characters, chain into apply
-                func=lambda x: x if x and len(x) == 10 else None # Format: (xxx) xxx-xxxx if 10-digit number, else invalid
-            ) # Removed additional formatting as this fails tests. Format segment: f"({x[:3]}) {x[3:6]}-{x[6:]}" (replaces x in lambda)
-    except TypeError as e:
+            digits = df[field].astype(object).str.strip().str.replace(NON_DIGIT_PATTERN, "", regex=True) # Strip whitespace, then remove all non-numeric characters
+            df[field] = digits.where(digits.str.len().eq(10), None) # Keep 10-digit numbers, else invalid (None)
+    except (TypeError, AttributeError) as e: # AttributeError: .str on a non-string column
         logger.error(f"Unable to parse all values in column {field}: {e}")
 
     return df
@@ -85,7 +91,7 @@ def clean_text(df: pd.DataFrame, field: str) -> pd.DataFrame:
     Hint: Use pandas string methods. See 'Pandas Fundamentals for ETL' and 'Data Quality & Cleaning with Pandas'.
     """
     try:
-        df[field] = df[field].str.strip().str.replace(r"[^\w\s.,!]", "").str.capitalize() if field in df.columns else pd.NA # Using NA flags for dropna(), using None doesn't necessarily guarantee it'll be dropped
+        df[field] = df[field].str.strip().str.replace(TEXT_SPECIAL_CHARS_PATTERN, "", regex=True).str.capitalize() if field in df.columns else pd.NA # Using NA flags for dropna(), using None doesn't necessarily guarantee it'll be dropped
     except TypeError as e:
         logger.error(f"Unable to convert column \"{field}\" to standard format: {e}")
 
@@ -103,12 +109,9 @@ def handle_missing_values(df: pd.DataFrame, strategy='drop', fill_value=None):
     """Handle missing values using specified strategy ('drop', 'fill').
     Hint: Use pandas.dropna or pandas.fillna. See 'Data Quality & Cleaning with Pandas'.
     """
-    match strategy:
-        case 'drop':
-            df.dropna(inplace=True)
-        case 'fill':
-            df.fillna(fill_value, inplace=True)
-        case _:
-            logger.error("Invalid strategy option specified, canceling operation")
-
-    return df
\ No newline at end of file
+    handler = MISSING_VALUE_STRATEGIES.get(strategy)
+    if handler is None:
+        logger.error("Invalid strategy option specified, canceling operation")
+        return df
+
+    return handler(df, fill_value)
\ No newline at end of file
@@ -32,11 +32,12 @@ def check_duplicates(df: pd.DataFrame, field: str):
     """Check for duplicate values in a field and return a summary or list.
     Hint: Use pandas.duplicated and value_counts. See 'Data Quality & Cleaning with Pandas'.
     """
-    ftypes = (df.map(type) == list).all() # Check for all fields that are lists
-    if field in df.columns and ftypes.get(field): # Skip if the field is a list
-        duplicates = df[df[field].duplicated()].value_counts().to_dict()
-        return duplicates
-    else:
+    if field not in df.columns:
+        return None
+    try:
+        counts = df[field].value_counts(dropna=False) # One hash aggregation over the whole column
+        return counts[counts > 1].to_dict() # Duplicate value -> number of occurrences
+    except TypeError: # Skip if the field holds lists (unhashable, so they can't be counted)
         return None
 
 def quality_report(df: pd.DataFrame):
@@ -74,7 +75,7 @@ def quality_report(df: pd.DataFrame):
         
 
         for field in all_duplicates.keys():
-            total_duplicates = df.duplicated(subset=field).sum()
+            total_duplicates = sum(all_duplicates[field].values()) - len(all_duplicates[field]) # Every occurrence after the first of each duplicate value
             logger.warning(f"{field}: {((1 - (float(total_duplicates) / max(df[field].count(), 1))) * 100):.2f}% unique values") # Calculate duplicate fraction, subtract from 1 to get unique fraction, convert to percent
 
     # Missing functions taken from solution
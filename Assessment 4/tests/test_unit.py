@@ -62,6 +62,11 @@ def test_clean_phone_numbers():
     assert cleaned['phone'].iloc[0] == '1234567890'
     assert cleaned['phone'].iloc[1] is None
 
+def test_clean_non_string_column_unchanged():
+    df = pd.DataFrame({'email': [1, 2], 'phone': [1234567890, 5]})
+    assert cleaning.clean_emails(df.copy(), 'email')['email'].tolist() == [1, 2]
+    assert cleaning.clean_phone_numbers(df.copy(), 'phone')['phone'].tolist() == [1234567890, 5]
+
 def test_clean_numerics():
     df = pd.DataFrame({'num': ['10', 'bad', None]})
     cleaned = cleaning.clean_numerics(df.copy(), 'num')
@@ -74,6 +79,11 @@ def test_clean_text():
     assert cleaned['txt'].iloc[0] == 'Hello'
     assert cleaned['txt'].iloc[1] == 'World'
 
+def test_clean_text_removes_special_characters():
+    df = pd.DataFrame({'txt': ['  hello@world#, again! ']})
+    cleaned = cleaning.clean_text(df.copy(), 'txt')
+    assert cleaned['txt'].iloc[0] == 'Helloworld, again!'
+
 def test_remove_duplicates():
     df = pd.DataFrame({'a': [1, 1, 2]})
     cleaned = cleaning.remove_duplicates(df.copy(), subset=['a'])
@@ -91,6 +101,12 @@ def test_handle_missing_values_unknown_strategy():
     result = cleaning.handle_missing_values(df.copy(), strategy='unknown')
     assert isinstance(result, pd.DataFrame)
 
+def test_check_duplicates():
+    df = pd.DataFrame({'a': ['x', 'y', 'x', 'x', 'z'], 'genres': [['a'], ['a'], ['b'], [], ['c']]})
+    assert data_quality.check_duplicates(df, 'a') == {'x': 3}
+    assert data_quality.check_duplicates(df, 'genres') is None
+    assert data_quality.check_duplicates(df, 'missing') is None
+
 def test_validate_field_level():
     df = pd.DataFrame({'isbn': ['9781234567890', 'bad'], 'title': ['Book', '']})
     rules = {'isbn': {'type': 'string', 'pattern': r'^97[89]\d{10}$', 'required': True}, 'title': {'type': 'string', 'min_length': 1, 'required': True}}